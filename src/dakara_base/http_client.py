@@ -13,26 +13,86 @@ JSON messages.  It is pretty straightforward to use:
 >>> client.authenticate()
 >>> data = client.get("library/songs/")
 >>> client.post("library/songs", json={"title": "some title"})
+
+The client keeps a persistent session, so that connections to the server are
+reused between requests. It should be closed when not needed anymore, which
+can be done by using it as a context manager:
+
+>>> with HTTPClient(config, endpoint_prefix="api/") as client:
+...     client.authenticate()
+...     data = client.get("library/songs/")
+
+Responses of GET requests can be cached on disk if the `cache` key of the
+config is true. This feature requires the requests-cache library, which is an
+optional dependency of the project.
+
+The module also provides the `AsyncHTTPClient` class, which has the same
+interface with coroutines, built on the aiohttp library. This library is an
+optional dependency of the project.
+
+JSON responses are parsed with the orjson library if it is installed, which is
+faster than the standard library.
 """
 
+import asyncio
+import hashlib
 import logging
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from json import JSONDecodeError
 
 import requests
 from furl import furl
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as json_loads
+
+except ImportError:
+    from json import loads as json_loads
 
+try:
+    import aiohttp
+
+except ImportError:
+    aiohttp = None
+
+try:
+    import requests_cache
+
+except ImportError:
+    requests_cache = None
+
+from dakara_base.directory import directories
 from dakara_base.exceptions import DakaraError
 from dakara_base.utils import create_url, truncate_message
 
 logger = logging.getLogger(__name__)
 
 
+HTTP_METHODS = frozenset(("get", "post", "put", "patch", "delete", "head", "options"))
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 100
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.2
+RETRY_STATUS_FORCELIST = (502, 503, 504)
+MAX_WORKERS = 8
+URL_CACHE_SIZE = 256
+CACHE_NAME = "http_cache"
+CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 75
+
+
 def authenticated(fun):
     """Decorator that ensures the token is set.
 
     It makes sure that the given function is called only if authenticated. If
     not authenticated, calling the function will raise a `NotAuthenticatedError`.
 
+    The methods of `HTTPClient` perform this check directly, the decorator is
+    kept for other classes holding a token.
+
     Args:
         fun (function): Function to decorate.
 
@@ -50,14 +110,76 @@ def authenticated(fun):
     return call
 
 
-class HTTPClient:
-    """HTTP client designed to work with an API.
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def join_url(server_url, endpoint):
+    """Create the URL of an endpoint.
 
-    The API must use JSON for message content.
+    The result is cached, as the same endpoints are usually requested
+    repeatedly.
 
-    The client uses a token credential policy only and authenticates with a
-    traditional login/password mechanism. If a token is provided, it will be
-    used without trying to authenticate.
+    Args:
+        server_url (str): URL of the server.
+        endpoint (str): Endpoint added to the end of the server URL.
+
+    Returns:
+        str: URL of the endpoint.
+    """
+    return furl(server_url).add(path=endpoint).url
+
+
+def parse_json(content):
+    """Parse JSON content of a response.
+
+    Parsing errors are raised as `requests.exceptions.JSONDecodeError`, like
+    `requests.Response.json` does, whatever the JSON library used.
+
+    Args:
+        content (bytes): Content to parse.
+
+    Returns:
+        object: Parsed content.
+
+    Raises:
+        requests.exceptions.JSONDecodeError: If the content is not valid JSON.
+    """
+    try:
+        return json_loads(content)
+
+    except JSONDecodeError as error:
+        raise requests.exceptions.JSONDecodeError(
+            error.msg, error.doc, error.pos
+        ) from error
+
+
+def create_cache_key(request, **kwargs):
+    """Create the key of a request for the cache of `HTTPClient`.
+
+    The authorization header is ignored by requests-cache, so that the token
+    is not stored in the cache. A hash of this header is added to the key
+    instead, hence a cached response is never served to a client using
+    another token.
+
+    Args:
+        request (requests.PreparedRequest): Request to create the key of.
+        Extra arguments are passed to `requests_cache.create_key`.
+
+    Returns:
+        str: Key of the request.
+    """
+    key = requests_cache.create_key(request, **kwargs)
+    authorization = request.headers.get("Authorization", "")
+    authorization_hash = hashlib.sha256(authorization.encode()).hexdigest()[:16]
+
+    return f"{key}_{authorization_hash}"
+
+
+class BaseHTTPClient:
+    """Base class of the HTTP clients.
+
+    It holds the configuration, the token and the validation logic shared by
+    `HTTPClient` and `AsyncHTTPClient`. Subclasses must create their session
+    and set the token from the config once the session exists, as setting the
+    token calls `set_authorization`.
 
     Attributes:
         AUTHENTICATE_ENDPOINT (str): Endpoint for authentication.
@@ -89,10 +211,32 @@ class HTTPClient:
         self.server_url = create_url(**config, path=endpoint_prefix)
 
         # authentication
-        self.token = config.get("token")
+        self._token = None
         self.login = config.get("login")
         self.password = config.get("password")
 
+    @property
+    def token(self):
+        """str: Value of the token.
+
+        Setting the token also sets the authorization header of the session,
+        so that it is sent with each request.
+        """
+        return self._token
+
+    @token.setter
+    def token(self, value):
+        self._token = value
+        self.set_authorization(None if value is None else f"Token {value}")
+
+    def set_authorization(self, authorization):
+        """Set the authorization header sent with each request.
+
+        Args:
+            authorization (str): Value of the header. None to remove it.
+        """
+        raise NotImplementedError()
+
     def load(self):
         """Perform side effect actions.
 
@@ -106,6 +250,253 @@ class HTTPClient:
                 "and 'password' in config file"
             )
 
+    def check_authenticated(self):
+        """Check the client is authenticated.
+
+        Raises:
+            NotAuthenticatedError: If the client is not authenticated.
+        """
+        if self.token is None:
+            raise NotAuthenticatedError("No connection established")
+
+    def prepare_request(self, method, endpoint, message_on_error):
+        """Check and complete the parameters of a request.
+
+        Args:
+            method (str): Name of the HTTP method to use.
+            endpoint (str): Endpoint to send the request to. Will be added to
+                the end of the server URL.
+            message_on_error (str): Message to display in logs in case of
+                error.
+
+        Returns:
+            tuple: Name of the method in lower case, URL of the endpoint and
+            message to display in logs in case of error.
+
+        Raises:
+            MethodError: If the method is not supported.
+        """
+        # handle method
+        method = method.lower()
+        if method not in HTTP_METHODS:
+            raise MethodError(f"Method {method} not supported")
+
+        # handle message on error
+        if not message_on_error:
+            message_on_error = "Unable to request the server"
+
+        # forge URL
+        url = join_url(self.server_url, endpoint)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending %s request to %s", method.upper(), url)
+
+        return method, url, message_on_error
+
+    @staticmethod
+    def log_invalid_response(message_on_error, status, text):
+        """Log the error of an unsuccessful response.
+
+        Args:
+            message_on_error (str): Message describing what the request was
+                about.
+            status (int): Status code of the response.
+            text (str): Text of the response.
+        """
+        logger.error(message_on_error)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Error %i: %s", status, truncate_message(text))
+
+    @staticmethod
+    def create_authentication_error(status, text):
+        """Create the error of an unsuccessful authentication.
+
+        Args:
+            status (int): Status code of the response.
+            text (str): Text of the response.
+
+        Returns:
+            AuthenticationError: Error to raise.
+        """
+        # manage failed connection response
+        if status == 400:
+            return AuthenticationError("Login to server failed, check the config file")
+
+        # manage any other error
+        return AuthenticationError(
+            "Unable to authenticate to the server, error "
+            f"{status}: {truncate_message(text)}"
+        )
+
+    def store_token(self, content):
+        """Store the token given by a successful authentication.
+
+        Args:
+            content (bytes): Content of the response of the authentication.
+        """
+        self.token = parse_json(content).get("token")
+        logger.info("Login to server successful")
+        logger.debug("Token: %s", self.token)
+
+    def get_token_header(self):
+        """Get the connection token as it should appear in the header.
+
+        Can be called only after a successful authentication.
+
+        Returns:
+            dict: Formatted token.
+
+        Raises:
+            NotAuthenticatedError: If the client is not authenticated.
+        """
+        self.check_authenticated()
+
+        return {"Authorization": f"Token {self.token}"}
+
+
+class HTTPClient(BaseHTTPClient):
+    """HTTP client designed to work with an API.
+
+    The API must use JSON for message content.
+
+    The client uses a token credential policy only and authenticates with a
+    traditional login/password mechanism. If a token is provided, it will be
+    used without trying to authenticate.
+
+    The client uses a persistent `requests.Session`, hence the underlying
+    connections to the server are reused among requests. The session is
+    released by calling `close`, or by using the client as a context manager.
+    The size of the connection pool can be tuned with the `pool_connections`
+    and `pool_maxsize` keys of the config. Several endpoints can be requested
+    concurrently with `get_many`. Responses of GET requests can be cached on
+    disk, see `create_session`. Idempotent requests are retried on
+    connection errors or if the server is temporarily unavailable.
+
+    Attributes:
+        AUTHENTICATE_ENDPOINT (str): Endpoint for authentication.
+        mute_raise (bool): If true, no exception will be raised when performing
+            connections with the server (but authentication), only logged.
+        server_url (str): URL of the server.
+        token (str): Value of the token. The token is set when successfuly
+            calling `authenticate`.
+        login (str): Login used for authentication.
+        password (str): Password used for authentication.
+
+    Args:
+        config (dict): Config of the server.
+        endpoint_prefix (str): Prefix of the endpoint, added to the URL.
+        mute_raise (bool): If true, no exception will be raised when performing
+            connections with the server (but authentication), only logged.
+
+    Raises:
+        ParameterError: If critical parameters cannot be found in the
+            configuration.
+    """
+
+    def __init__(self, config, endpoint_prefix="", mute_raise=False):
+        super().__init__(config, endpoint_prefix, mute_raise)
+
+        # executor for concurrent requests
+        max_workers = config.get("max_workers", MAX_WORKERS)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        # session
+        self._session = self.create_session(config)
+        retry = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_FORCELIST,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=config.get("pool_connections", POOL_CONNECTIONS),
+            # threads of the executor must not wait for a connection
+            pool_maxsize=max(config.get("pool_maxsize", POOL_MAXSIZE), max_workers),
+            max_retries=retry,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # authentication, once the session exists
+        self.token = config.get("token")
+
+    def create_session(self, config):
+        """Create the session of the client.
+
+        If the `cache` key of the config is true, responses of GET requests
+        are cached on disk by a `requests_cache.CachedSession`. The cache is
+        stored in the file given by the `cache_path` key of the config, or in
+        a file of the user cache directory specific to the server URL of the
+        client, and responses expire after `cache_ttl` seconds. Expired
+        responses are revalidated with the server if possible. Cached
+        responses are specific to the token of the client, see
+        `create_cache_key`.
+
+        Args:
+            config (dict): Config of the server.
+
+        Returns:
+            requests.Session: Session object.
+
+        Raises:
+            MissingDependencyError: If the cache is requested but
+                requests-cache is not installed.
+        """
+        if not config.get("cache"):
+            return requests.Session()
+
+        if requests_cache is None:
+            raise MissingDependencyError(
+                "The requests-cache library must be installed to use HTTP cache"
+            )
+
+        cache_path = config.get("cache_path")
+        if cache_path is None:
+            url_hash = hashlib.sha256(self.server_url.encode()).hexdigest()[:16]
+            cache_path = directories.user_cache_path / f"{CACHE_NAME}_{url_hash}"
+
+        return requests_cache.CachedSession(
+            cache_name=str(cache_path),
+            backend="sqlite",
+            expire_after=config.get("cache_ttl", CACHE_TTL),
+            allowable_methods=("GET",),
+            key_fn=create_cache_key,
+        )
+
+    def set_authorization(self, authorization):
+        """Set the authorization header of the session.
+
+        Args:
+            authorization (str): Value of the header. None to remove it.
+        """
+        if authorization is None:
+            self._session.headers.pop("Authorization", None)
+            return
+
+        self._session.headers["Authorization"] = authorization
+
+    def __enter__(self):
+        """Context manager enter.
+
+        Returns:
+            HTTPClient: The instance itself.
+        """
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        """Context manager exit.
+
+        Closes the session.
+        """
+        self.close()
+
+    def close(self):
+        """Close the session and release its connections.
+
+        Wait for the pending requests of `get_many` to finish.
+        """
+        self._executor.shutdown()
+        self._session.close()
+
     def send_request_raw(
         self,
         method,
@@ -129,8 +520,8 @@ class HTTPClient:
                 successful, it will receive the response and must return an
                 exception that will be raised. If not provided, a basic error
                 management is done.
-            Extra arguments are passed to requests' get/post/put/patch/delete
-                methods.
+            Extra arguments are passed to the `request` method of the
+                session.
 
         Returns:
             requests.models.Response: Response object.
@@ -141,29 +532,19 @@ class HTTPClient:
             ResponseInvalidError: If the response has an error code different
                 to 2**.
         """
-        # handle method function
-        if not hasattr(requests, method):
-            raise MethodError("Method {} not supported".format(method))
-
-        send_method = getattr(requests, method)
-
-        # handle message on error
-        if not message_on_error:
-            message_on_error = "Unable to request the server"
-
-        # forge URL
-        url = furl(self.server_url).add(path=endpoint).url
-        logger.debug("Sending %s request to %s", method.upper(), url)
+        method, url, message_on_error = self.prepare_request(
+            method, endpoint, message_on_error
+        )
 
         try:
             # send request to the server
-            response = send_method(url, *args, **kwargs)
+            response = self._session.request(method, url, *args, **kwargs)
 
         except requests.exceptions.RequestException as error:
             # handle connection error
             logger.error("%s, communication error", message_on_error)
             raise ResponseRequestError(
-                "Error when communicating with the server: {}".format(error)
+                f"Error when communicating with the server: {error}"
             ) from error
 
         # return here if the request was made without error
@@ -175,22 +556,18 @@ class HTTPClient:
             raise function_on_error(response)
 
         # otherwise manage error generically
-        logger.error(message_on_error)
-        logger.debug(
-            "Error %i: %s", response.status_code, truncate_message(response.text)
-        )
+        self.log_invalid_response(message_on_error, response.status_code, response.text)
 
         raise ResponseInvalidError(
-            "Error {} when communicationg with the server: {}".format(
-                response.status_code, response.text
-            )
+            f"Error {response.status_code} when communicationg with the server: "
+            f"{response.text}"
         )
 
-    @authenticated
     def send_request(self, *args, **kwargs):
         """Generic method to send requests to the server when connected.
 
-        It adds token header for authentication and takes care of errors.
+        The token header for authentication is provided by the session. It
+        takes care of errors.
         If `mute_raise` is set, no exceptions are raised in case of error when
         communicating with the server.
 
@@ -206,12 +583,13 @@ class HTTPClient:
             ResponseRequestError: For any error when communicating with the server.
             ResponseInvalidError: If the response has an error code different
                 to 2**.
+            NotAuthenticatedError: If the client is not authenticated.
         """
+        self.check_authenticated()
+
         try:
             # make the request
-            return self.send_request_raw(
-                *args, headers=self.get_token_header(), **kwargs
-            )
+            return self.send_request_raw(*args, **kwargs)
 
         # manage request error
         except ResponseError:
@@ -232,15 +610,18 @@ class HTTPClient:
                 successful, it will receive the response and must return an
                 exception that will be raised. If not provided, a basic error
                 management is done.
-            Extra arguments are passed to requests' get method.
+            Extra arguments are passed to the `request` method of the
+                session.
 
         Returns:
-            dict: Response object from the server.
+            dict: Response object from the server. None if an error occurs
+            when communicating with the server and `mute_raise` is set.
 
         Raises:
             ResponseRequestError: For any error when communicating with the server.
             ResponseInvalidError: If the response has an error code different
                 to 2**.
+            NotAuthenticatedError: If the client is not authenticated.
         """
         return self.get_json_from_response(self.send_request("get", *args, **kwargs))
 
@@ -256,16 +637,18 @@ class HTTPClient:
                 successful, it will receive the response and must return an
                 exception that will be raised. If not provided, a basic error
                 management is done.
-            Extra arguments are passed to requests' post method.
-
+            Extra arguments are passed to the `request` method of the
+                session.
 
         Returns:
-            dict: Response object from the server.
+            dict: Response object from the server. None if an error occurs
+            when communicating with the server and `mute_raise` is set.
 
         Raises:
             ResponseRequestError: For any error when communicating with the server.
             ResponseInvalidError: If the response has an error code different
                 to 2**.
+            NotAuthenticatedError: If the client is not authenticated.
         """
         return self.get_json_from_response(self.send_request("post", *args, **kwargs))
 
@@ -281,15 +664,18 @@ class HTTPClient:
                 successful, it will receive the response and must return an
                 exception that will be raised. If not provided, a basic error
                 management is done.
-            Extra arguments are passed to requests' put method.
+            Extra arguments are passed to the `request` method of the
+                session.
 
         Returns:
-            dict: Response object from the server.
+            dict: Response object from the server. None if an error occurs
+            when communicating with the server and `mute_raise` is set.
 
         Raises:
             ResponseRequestError: For any error when communicating with the server.
             ResponseInvalidError: If the response has an error code different
                 to 2**.
+            NotAuthenticatedError: If the client is not authenticated.
         """
         return self.get_json_from_response(self.send_request("put", *args, **kwargs))
 
@@ -305,20 +691,23 @@ class HTTPClient:
                 successful, it will receive the response and must return an
                 exception that will be raised. If not provided, a basic error
                 management is done.
-            Extra arguments are passed to requests' patch method.
+            Extra arguments are passed to the `request` method of the
+                session.
 
         Returns:
-            dict: Response object from the server.
+            dict: Response object from the server. None if an error occurs
+            when communicating with the server and `mute_raise` is set.
 
         Raises:
             ResponseRequestError: For any error when communicating with the server.
             ResponseInvalidError: If the response has an error code different
                 to 2**.
+            NotAuthenticatedError: If the client is not authenticated.
         """
         return self.get_json_from_response(self.send_request("patch", *args, **kwargs))
 
     def delete(self, *args, **kwargs):
-        """Generic method to patch data on server.
+        """Generic method to delete data on server.
 
         Args:
             endpoint (str): Endpoint to send the request to. Will be added to
@@ -329,18 +718,45 @@ class HTTPClient:
                 successful, it will receive the response and must return an
                 exception that will be raised. If not provided, a basic error
                 management is done.
-            Extra arguments are passed to requests' delete method.
+            Extra arguments are passed to the `request` method of the
+                session.
 
         Returns:
-            dict: Response object from the server.
+            dict: Response object from the server. None if an error occurs
+            when communicating with the server and `mute_raise` is set.
 
         Raises:
             ResponseRequestError: For any error when communicating with the server.
             ResponseInvalidError: If the response has an error code different
                 to 2**.
+            NotAuthenticatedError: If the client is not authenticated.
         """
         return self.get_json_from_response(self.send_request("delete", *args, **kwargs))
 
+    def get_many(self, endpoints, *args, **kwargs):
+        """Get data on server from several endpoints concurrently.
+
+        Requests are sent by the threads of an executor, whose number can be
+        set with the `max_workers` key of the config.
+
+        Args:
+            endpoints (list of str): Endpoints to send the requests to.
+            Other arguments are passed to `get`.
+
+        Returns:
+            list: Response objects from the server, in the same order as the
+            endpoints.
+
+        Raises:
+            See `get`.
+        """
+        futures = [
+            self._executor.submit(self.get, endpoint, *args, **kwargs)
+            for endpoint in endpoints
+        ]
+
+        return [future.result() for future in futures]
+
     def authenticate(self):
         """Authenticate with the server.
 
@@ -361,18 +777,7 @@ class HTTPClient:
         data = {"login": self.login, "password": self.password}
 
         def on_error(response):
-            # manage failed connection response
-            if response.status_code == 400:
-                return AuthenticationError(
-                    "Login to server failed, check the config file"
-                )
-
-            # manage any other error
-            return AuthenticationError(
-                "Unable to authenticate to the server, error {code}: {message}".format(
-                    code=response.status_code, message=truncate_message(response.text)
-                )
-            )
+            return self.create_authentication_error(response.status_code, response.text)
 
         # connect to the server with login/password
         logger.debug("Authenticate to the server")
@@ -385,34 +790,369 @@ class HTTPClient:
         )
 
         # store token
-        self.token = response.json().get("token")
-        logger.info("Login to server successful")
-        logger.debug("Token: %s", self.token)
+        self.store_token(response.content)
 
-    @authenticated
-    def get_token_header(self):
-        """Get the connection token as it should appear in the header.
+    @staticmethod
+    def get_json_from_response(response):
+        """Parse the response of a request if possible.
 
-        Can be called only after a successful authentication.
+        Args:
+            response (requests.models.Response): Response of a request.
 
         Returns:
-            dict: Formatted token.
+            dict: Parsed response. None if no response was given or response
+            has no content.
+
+        Raises:
+            requests.exceptions.JSONDecodeError: If the response is not valid
+                JSON.
+        """
+        if response and response.content:
+            return parse_json(response.content)
+
+        return None
+
+
+class AsyncHTTPClient(BaseHTTPClient):
+    """Asynchronous HTTP client designed to work with an API.
+
+    This is the asynchronous counterpart of `HTTPClient`, built on the aiohttp
+    library, which must be installed. Requests are coroutines, hence
+    independent requests can be sent concurrently:
+
+    >>> async with AsyncHTTPClient(config, endpoint_prefix="api/") as client:
+    ...     await client.authenticate()
+    ...     songs, playlist = await asyncio.gather(
+    ...         client.get("library/songs/"), client.get("playlist/entries/")
+    ...     )
+
+    The session of the client is created on the first request and is released
+    by calling `close`, or by using the client as an asynchronous context
+    manager.
+
+    Attributes and arguments are the ones of `BaseHTTPClient`.
+
+    Raises:
+        MissingDependencyError: If aiohttp is not installed.
+        ParameterError: If critical parameters cannot be found in the
+            configuration.
+    """
+
+    def __init__(self, config, endpoint_prefix="", mute_raise=False):
+        if aiohttp is None:
+            raise MissingDependencyError(
+                "The aiohttp library must be installed to use AsyncHTTPClient"
+            )
+
+        super().__init__(config, endpoint_prefix, mute_raise)
+
+        # session, created on first request
+        self._session = None
+        self._headers = {}
+        self._pool_maxsize = config.get("pool_maxsize", POOL_MAXSIZE)
+
+        # authentication, once the headers exist
+        self.token = config.get("token")
+
+    def set_authorization(self, authorization):
+        """Set the authorization header of the session.
+
+        Args:
+            authorization (str): Value of the header. None to remove it.
+        """
+        if authorization is None:
+            self._headers.pop("Authorization", None)
+
+        else:
+            self._headers["Authorization"] = authorization
+
+        if self._session is not None:
+            self._session.headers.clear()
+            self._session.headers.update(self._headers)
+
+    def get_session(self):
+        """Get the session, create it if needed.
+
+        Must be called from a coroutine.
+
+        Returns:
+            aiohttp.ClientSession: Session of the client.
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                headers=self._headers,
+                connector=aiohttp.TCPConnector(
+                    limit=self._pool_maxsize,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ),
+            )
+
+        return self._session
+
+    async def __aenter__(self):
+        """Asynchronous context manager enter.
+
+        Returns:
+            AsyncHTTPClient: The instance itself.
+        """
+        return self
+
+    async def __aexit__(self, *args, **kwargs):
+        """Asynchronous context manager exit.
+
+        Closes the session.
+        """
+        await self.close()
+
+    async def close(self):
+        """Close the session and release its connections."""
+        if self._session is None:
+            return
+
+        await self._session.close()
+        self._session = None
+
+    async def send_request_raw(
+        self,
+        method,
+        endpoint,
+        message_on_error="",
+        function_on_error=None,
+        **kwargs,
+    ):
+        """Generic coroutine to send requests to the server.
+
+        It takes care of errors and raises exceptions. The body of the
+        response is read before the response is returned.
+
+        Args:
+            method (str): Name of the HTTP method to use.
+            endpoint (str): Endpoint to send the request to. Will be added to
+                the end of the server URL.
+            message_on_error (str): Message to display in logs in case of
+                error. It should describe what the request was about.
+            function_on_error (function): Coroutine function called if the
+                request is not successful, it will receive the response and
+                must return an exception that will be raised. If not
+                provided, a basic error management is done.
+            Extra keyword arguments are passed to the `request` method of
+                the session.
+
+        Returns:
+            aiohttp.ClientResponse: Response object.
+
+        Raises:
+            MethodError: If the method is not supported.
+            ResponseRequestError: For any error when communicating with the server.
+            ResponseInvalidError: If the response has an error code different
+                to 2**.
+        """
+        method, url, message_on_error = self.prepare_request(
+            method, endpoint, message_on_error
+        )
+
+        try:
+            # send request to the server
+            response = await self.get_session().request(method, url, **kwargs)
+
+            # read the body, which releases the connection
+            await response.read()
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            # handle connection error
+            logger.error("%s, communication error", message_on_error)
+            raise ResponseRequestError(
+                f"Error when communicating with the server: {error}"
+            ) from error
+
+        # return here if the request was made without error
+        if response.ok:
+            return response
+
+        # otherwise call custom error management function
+        if function_on_error:
+            raise await function_on_error(response)
+
+        # otherwise manage error generically
+        text = await response.text(errors="replace")
+        self.log_invalid_response(message_on_error, response.status, text)
+
+        raise ResponseInvalidError(
+            f"Error {response.status} when communicationg with the server: {text}"
+        )
+
+    async def send_request(self, *args, **kwargs):
+        """Generic coroutine to send requests to the server when connected.
+
+        The token header for authentication is provided by the session. It
+        takes care of errors.
+        If `mute_raise` is set, no exceptions are raised in case of error when
+        communicating with the server.
+
+        Args:
+            See `send_request_raw`.
+
+        Returns:
+            aiohttp.ClientResponse: Response object. None if an error occurs
+            when communicating with the server and `mute_raise` is set.
+
+        Raises:
+            MethodError: If the method is not supported.
+            ResponseRequestError: For any error when communicating with the server.
+            ResponseInvalidError: If the response has an error code different
+                to 2**.
+            NotAuthenticatedError: If the client is not authenticated.
+        """
+        self.check_authenticated()
+
+        try:
+            # make the request
+            return await self.send_request_raw(*args, **kwargs)
+
+        # manage request error
+        except ResponseError:
+            if self.mute_raise:
+                return None
+
+            raise
+
+    async def get(self, *args, **kwargs):
+        """Generic coroutine to get data on server.
+
+        Args:
+            See `HTTPClient.get`.
+
+        Returns:
+            dict: Response object from the server. None if an error occurs
+            when communicating with the server and `mute_raise` is set.
+
+        Raises:
+            See `HTTPClient.get`.
         """
-        return {"Authorization": "Token " + self.token}
+        return await self.get_json_from_response(
+            await self.send_request("get", *args, **kwargs)
+        )
+
+    async def post(self, *args, **kwargs):
+        """Generic coroutine to post data on server.
+
+        Args:
+            See `HTTPClient.post`.
+
+        Returns:
+            dict: Response object from the server. None if an error occurs
+            when communicating with the server and `mute_raise` is set.
+
+        Raises:
+            See `HTTPClient.post`.
+        """
+        return await self.get_json_from_response(
+            await self.send_request("post", *args, **kwargs)
+        )
+
+    async def put(self, *args, **kwargs):
+        """Generic coroutine to put data on server.
+
+        Args:
+            See `HTTPClient.put`.
+
+        Returns:
+            dict: Response object from the server. None if an error occurs
+            when communicating with the server and `mute_raise` is set.
+
+        Raises:
+            See `HTTPClient.put`.
+        """
+        return await self.get_json_from_response(
+            await self.send_request("put", *args, **kwargs)
+        )
+
+    async def patch(self, *args, **kwargs):
+        """Generic coroutine to patch data on server.
+
+        Args:
+            See `HTTPClient.patch`.
+
+        Returns:
+            dict: Response object from the server. None if an error occurs
+            when communicating with the server and `mute_raise` is set.
+
+        Raises:
+            See `HTTPClient.patch`.
+        """
+        return await self.get_json_from_response(
+            await self.send_request("patch", *args, **kwargs)
+        )
+
+    async def delete(self, *args, **kwargs):
+        """Generic coroutine to delete data on server.
+
+        Args:
+            See `HTTPClient.delete`.
+
+        Returns:
+            dict: Response object from the server. None if an error occurs
+            when communicating with the server and `mute_raise` is set.
+
+        Raises:
+            See `HTTPClient.delete`.
+        """
+        return await self.get_json_from_response(
+            await self.send_request("delete", *args, **kwargs)
+        )
+
+    async def authenticate(self):
+        """Authenticate with the server.
+
+        The authentication process relies on login/password which gives an
+        authentication token. This token is stored in the instance.
+
+        If a token was specified in the config, this function does nothing.
+
+        Raises:
+            See `send_request_raw`.
+            AuthenticationError: If the connection is denied or if any onther
+                error occurs.
+        """
+
+        if self.token:
+            return
+
+        data = {"login": self.login, "password": self.password}
+
+        async def on_error(response):
+            return self.create_authentication_error(
+                response.status, await response.text()
+            )
+
+        # connect to the server with login/password
+        logger.debug("Authenticate to the server")
+        response = await self.send_request_raw(
+            "post",
+            self.AUTHENTICATE_ENDPOINT,
+            message_on_error="Unable to authenticate to the server",
+            function_on_error=on_error,
+            json=data,
+        )
+
+        # store token
+        self.store_token(await response.read())
 
     @staticmethod
-    def get_json_from_response(response):
+    async def get_json_from_response(response):
         """Parse the response of a request if possible.
 
         Args:
-            response (requests.models.Response): Response of a request.
+            response (aiohttp.ClientResponse): Response of a request.
 
         Returns:
             dict: Parsed response. None if no response was given or response
             has no content.
         """
-        if response and response.text:
-            return response.json()
+        if response:
+            content = await response.read()
+            if content:
+                return parse_json(content)
 
         return None
 
@@ -443,3 +1183,7 @@ class MethodError(DakaraError, ValueError):
 
 class NotAuthenticatedError(DakaraError):
     """Error raised when authentication is missing."""
+
+
+class MissingDependencyError(DakaraError, ImportError):
+    """Error raised when an optional dependency is not installed."""
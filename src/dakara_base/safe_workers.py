@@ -15,22 +15,31 @@ A main concept of this module is that a Python Event object is shared among the
 instances of the classes of this module. This event is reffered as the stop
 event, as it can be used to stop the program. A Python Queue object is also
 shared among the different instances and allows to retreive exceptions raised
-in sub-threads by the main one.
+in sub-threads by the main one. As only the first exception matters, the
+lighter `ErrorSlot` object can be used instead, which is what the `Runner`
+class does. These objects are passed as is, and never copied: all the workers
+and threads of a runner refer to the very same stop event and errors queue.
 
 >>> from threading import Event
 >>> from queue import Queue
 >>> stop = Event()
 >>> errors = Queue()
+>>> class MyWorker(WorkerSafeThread):
+...     def init_worker(self):
+...         return self.stop.set
 >>> worker = Worker(stop, errors)
->>> worker_with_thread = WorkerSafeThread(stop, errors)
->>> worker_with_timer = WorkerSafeTimer(stop, errors)
+>>> worker_with_thread = MyWorker(stop, errors)
 >>> worker.stop.set()
 >>> worker_with_thread.stop.is_set()
 True
 """
 
 import logging
+import selectors
+import signal
+import socket
 import sys
+import traceback
 from functools import wraps
 from queue import Empty, Queue
 from threading import Event, Thread, Timer
@@ -39,40 +48,269 @@ from dakara_base.exceptions import DakaraError
 
 logger = logging.getLogger(__name__)
 
+IS_WINDOWS = sys.platform.startswith("win")
+
 
 def safe(fun):
     """Decorator to make the function safe.
 
     Any exception is caught and put in the error queue. This sets the stop
-    event as well.
+    event as well, see `notify_error`.
 
     The decorated function must be a method of a BaseSafeThread or a BaseWorker
-    class (or inherited).
+    class (or inherited). This is checked only when an exception is caught,
+    so that the decorator does not slow down successful calls.
     """
 
     @wraps(fun)
     def call(self, *args, **kwargs):
-        # check the target's class is a safe thread or a safe worker
-        assert isinstance(self, (BaseSafeThread, BaseWorker)), (
-            "The class '{}' of method '{}' is not a "
-            "BaseSafeThread or a BaseWorker".format(
-                self.__class__.__name__, fun.__name__
-            )
-        )
-
         # try to run the target
         try:
             return fun(self, *args, **kwargs)
 
         # if an error occurs, put it in the error queue and notify the stop
         # event
-        except BaseException:
-            self.errors.put_nowait(sys.exc_info())
-            self.stop.set()
+        except BaseException as error:
+            # check the target's class is a safe thread or a safe worker
+            if not isinstance(self, SAFE_CLASSES):
+                raise TypeError(
+                    f"The class '{self.__class__.__name__}' of method "
+                    f"'{fun.__name__}' is not a BaseSafeThread or a BaseWorker"
+                ) from error
+
+            notify_error(self.stop, self.errors, error)
 
     return call
 
 
+def notify_error(stop, errors, error):
+    """Notify an error caught in a thread.
+
+    The error is put in the error queue, then the stop event is set. The error
+    is put beforehand, so that it is already available to waiters of the stop
+    event when they are notified.
+
+    Args:
+        stop (threading.Event): Stop event that notify to stop the entire
+            program when set.
+        errors (queue.Queue or ErrorSlot): Error queue to communicate the
+            exception to the main thread.
+        error (BaseException): Error caught.
+    """
+    # release the local variables of the frames of the traceback, so that they
+    # are not kept alive as long as the error is in the queue
+    traceback.clear_frames(error.__traceback__)
+
+    errors.put_nowait(error)
+    if not stop.is_set():
+        stop.set()
+
+
+def wait(stop):
+    """Wait for the stop event to be set.
+
+    The waiting can be interrupted by the user (Ctrl+C), which raises a
+    `KeyboardInterrupt`.
+
+    We have to use a different code for Windows because the Ctrl+C event will
+    not be handled during `stop.wait()`, which is due to the way Ctrl+C is
+    differently handled by the two OSs. For Windows, `wait_interruptible` is
+    used instead. In both cases, the stop event is not polled: the calling
+    thread sleeps until the event is set or Ctrl+C is hit.
+    More resources on this:
+    https://mail.python.org/pipermail/python-dev/2017-August/148800.html
+    https://stackoverflow.com/a/51954792/4584444
+
+    Args:
+        stop (threading.Event): Stop event to wait for.
+    """
+    if IS_WINDOWS:
+        wait_interruptible(stop)
+        return
+
+    stop.wait()
+
+
+def wait_interruptible(stop):
+    """Wait for the stop event to be set, in a way Ctrl+C can interrupt.
+
+    The function blocks on a selector watching a socket. The socket receives
+    a byte when a signal is received, thanks to `signal.set_wakeup_fd`, or
+    when the stop event is set, thanks to a helper thread. This way, the
+    function does not poll the stop event.
+
+    It can only be called from the main thread, otherwise it falls back to a
+    simple wait of the stop event.
+
+    Args:
+        stop (threading.Event): Stop event to wait for.
+    """
+    # do not set up the socket if the stop event is already set
+    if stop.is_set():
+        return
+
+    reader, writer = socket.socketpair()
+    with reader, writer:
+        reader.setblocking(False)
+        writer.setblocking(False)
+
+        # wake up the selector on signal
+        try:
+            previous_fd = signal.set_wakeup_fd(
+                writer.fileno(), warn_on_full_buffer=False
+            )
+
+        except ValueError:
+            # not in the main thread, signals cannot be received anyway
+            stop.wait()
+            return
+
+        # wake up the selector on stop event
+        def notify():
+            stop.wait()
+            try:
+                writer.send(b"\0")
+
+            except OSError:
+                # the socket is full or has been closed
+                pass
+
+        Thread(target=notify, daemon=True).start()
+
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(reader, selectors.EVENT_READ)
+                while not stop.is_set():
+                    selector.select()
+
+                    # drain the socket
+                    try:
+                        while reader.recv(4096):
+                            pass
+
+                    except BlockingIOError:
+                        pass
+
+        finally:
+            signal.set_wakeup_fd(previous_fd)
+
+
+class ErrorSlot:
+    """Slot keeping the first error raised among threads.
+
+    It is a lighter alternative to `queue.Queue` for the errors queue, as only
+    the first error is relevant to stop the program. It implements the subset
+    of the interface of `queue.Queue` used by this module. Errors put while
+    the slot is full are discarded.
+
+    Attributes:
+        ready (threading.Event): Event set when the slot contains an error.
+    """
+
+    __slots__ = ("_slot", "ready")
+
+    def __init__(self):
+        # the error is stored in a dictionary, as `dict.setdefault` is atomic
+        self._slot = {}
+        self.ready = Event()
+
+    def put_nowait(self, value):
+        """Put an error in the slot, if it is empty.
+
+        Args:
+            value (any): Error to put.
+        """
+        if self._slot.setdefault(None, value) is value:
+            self.ready.set()
+
+    put = put_nowait
+
+    def get(self, block=True, timeout=None):
+        """Get the error from the slot and empty it.
+
+        Args:
+            block (bool): If true, wait for an error to be put.
+            timeout (float): If `block` is true, maximum time to wait for, in
+                seconds. None means to wait indefinitely.
+
+        Returns:
+            any: Error.
+
+        Raises:
+            queue.Empty: If there is no error.
+        """
+        if not self.ready.wait(timeout if block else 0):
+            raise Empty
+
+        # clear the event before emptying the slot, so that an error put in
+        # the meantime sets it again
+        self.ready.clear()
+
+        try:
+            return self._slot.pop(None)
+
+        except KeyError as error:
+            raise Empty from error
+
+    def get_nowait(self):
+        """Get the error from the slot without waiting.
+
+        Returns:
+            any: Error.
+
+        Raises:
+            queue.Empty: If there is no error.
+        """
+        return self.get(block=False)
+
+    def empty(self):
+        """Tell if the slot is empty.
+
+        Returns:
+            bool: True if there is no error in the slot.
+        """
+        return not self._slot
+
+    def drain(self):
+        """Get all the errors from the slot and empty it.
+
+        Returns:
+            list: Errors, at most one.
+        """
+        try:
+            return [self.get_nowait()]
+
+        except Empty:
+            return []
+
+
+# classes accepted for the errors queue
+ERRORS_CLASSES = (Queue, ErrorSlot)
+
+
+def drain_errors(errors):
+    """Get all the errors from the errors queue at once and empty it.
+
+    For a `queue.Queue`, the errors are taken under a single acquisition of
+    the lock of the queue.
+
+    Args:
+        errors (queue.Queue or ErrorSlot): Error queue to drain.
+
+    Returns:
+        list: Errors, in the order they were put.
+    """
+    if isinstance(errors, ErrorSlot):
+        return errors.drain()
+
+    with errors.mutex:
+        drained = list(errors.queue)
+        errors.queue.clear()
+        errors.not_full.notify_all()
+
+    return drained
+
+
 class BaseSafeThread:
     """Base class for thread executed within a Worker.
 
@@ -90,21 +328,19 @@ class BaseSafeThread:
     Attributes:
         stop (threading.Event): Stop event that notify to stop the entire
             program when set.
-        errors (queue.Queue): Error queue to communicate the exception to the
-            main thread.
+        errors (queue.Queue or ErrorSlot): Error queue to communicate the
+            exception to the main thread.
 
     Args:
         stop (threading.Event): Stop event that notify to stop the entire
             program when set.
-        errors (queue.Queue): Error queue to communicate the exception to the
-            main thread.
+        errors (queue.Queue or ErrorSlot): Error queue to communicate the
+            exception to the main thread.
     """
 
-    def __init__(self, stop, errors, *args, **kwargs):
-        # check arguments are valid
-        assert isinstance(stop, Event), "Stop argument must be of type Event"
-        assert isinstance(errors, Queue), "Errors argument must be of type Queue"
+    __slots__ = ("stop", "errors")
 
+    def __init__(self, stop, errors, *args, **kwargs):
         # assign stop event and error queue
         self.stop = stop
         self.errors = errors
@@ -112,10 +348,14 @@ class BaseSafeThread:
         # specific initialization
         super().__init__(*args, **kwargs)
 
-    @safe
     def run(self):
         """Method to run as a thread safely."""
-        return super().run()
+        # the error handling of `safe` is inlined, as the class is known
+        try:
+            super().run()
+
+        except BaseException as error:
+            notify_error(self.stop, self.errors, error)
 
 
 class SafeThread(BaseSafeThread, Thread):
@@ -132,14 +372,14 @@ class SafeThread(BaseSafeThread, Thread):
     Attributes:
         stop (threading.Event): Stop event that notify to stop the entire
             program when set.
-        errors (queue.Queue): Error queue to communicate the exception to the
-            main thread.
+        errors (queue.Queue or ErrorSlot): Error queue to communicate the
+            exception to the main thread.
 
     Args:
         stop (threading.Event): Stop event that notify to stop the entire
             program when set.
-        errors (queue.Queue): Error queue to communicate the exception to the
-            main thread.
+        errors (queue.Queue or ErrorSlot): Error queue to communicate the
+            exception to the main thread.
 
     Consult the help of `threading.Thread` for more information.
     """
@@ -161,19 +401,34 @@ class SafeTimer(BaseSafeThread, Timer):
     Attributes:
         stop (threading.Event): Stop event that notify to stop the entire
             program when set.
-        errors (queue.Queue): Error queue to communicate the exception to the
-            main thread.
+        errors (queue.Queue or ErrorSlot): Error queue to communicate the
+            exception to the main thread.
 
     Args:
         stop (threading.Event): Stop event that notify to stop the entire
             program when set.
-        errors (queue.Queue): Error queue to communicate the exception to the
-            main thread.
+        errors (queue.Queue or ErrorSlot): Error queue to communicate the
+            exception to the main thread.
 
     Consult the help of `threading.timer` for more information.
     """
 
-    pass
+    def run(self):
+        """Method to run as a timer thread safely.
+
+        The function is not called if the stop event has been set during the
+        delay.
+        """
+        try:
+            self.finished.wait(self.interval)
+            if not self.finished.is_set() and not self.stop.is_set():
+                self.function(*self.args, **self.kwargs)
+
+        except BaseException as error:
+            notify_error(self.stop, self.errors, error)
+
+        finally:
+            self.finished.set()
 
 
 class BaseWorker:
@@ -192,31 +447,31 @@ class BaseWorker:
     Attributes:
         stop (threading.Event): Stop event that notify to stop the entire
             program when set.
-        errors (queue.Queue): Error queue to communicate the exception to the
-            main thread.
+        errors (queue.Queue or ErrorSlot): Error queue to communicate the
+            exception to the main thread.
 
     Args:
         stop (threading.Event): Stop event that notify to stop the entire
             program when set.
-        errors (queue.Queue): Error queue to communicate the exception to the
-            main thread.
-
-    Raises:
-        AssertionError: If the `stop` or `errors` arguments are not
-            respectivily Event and Queue.
+        errors (queue.Queue or ErrorSlot): Error queue to communicate the
+            exception to the main thread.
     """
 
+    __slots__ = ("stop", "errors")
+
     def __init__(self, stop, errors):
         # associate the stop event
-        assert isinstance(stop, Event), "Stop attribute must be of type Event"
         self.stop = stop
 
         # associate the errors queue
-        assert isinstance(errors, Queue), "Errors attribute must be of type Queue"
         self.errors = errors
 
     def init_worker(self):
-        """Custom init method stub."""
+        """Custom init method stub.
+
+        For `WorkerSafeThread` and `WorkerSafeTimer`, it can return the target
+        of the thread or of the timer of the worker.
+        """
         pass
 
     def __enter__(self):
@@ -238,8 +493,10 @@ class BaseWorker:
 
         Just triggers the stop event.
         """
-        # notify the stop event
-        self.stop.set()
+        # notify the stop event, if not already done, as setting the event
+        # acquires its lock
+        if not self.stop.is_set():
+            self.stop.set()
 
     def exit_worker(self, *args, **kwargs):
         """Custom exit method stub."""
@@ -268,6 +525,10 @@ class BaseWorker:
         return SafeTimer(self.stop, self.errors, *args, **kwargs)
 
 
+# classes which methods can be decorated by `safe`
+SAFE_CLASSES = (BaseSafeThread, BaseWorker)
+
+
 class Worker(BaseWorker):
     """Worker class.
 
@@ -291,14 +552,14 @@ class Worker(BaseWorker):
     Attributes:
         stop (threading.Event): Stop event that notify to stop the entire
             program when set.
-        errors (queue.Queue): Error queue to communicate the exception to the
-            main thread.
+        errors (queue.Queue or ErrorSlot): Error queue to communicate the
+            exception to the main thread.
 
     Args:
         stop (threading.Event): Stop event that notify to stop the entire
             program when set.
-        errors (queue.Queue): Error queue to communicate the exception to the
-            main thread.
+        errors (queue.Queue or ErrorSlot): Error queue to communicate the
+            exception to the main thread.
     """
 
     def __init__(self, stop, errors, *args, **kwargs):
@@ -329,9 +590,9 @@ class WorkerSafeTimer(BaseWorker):
     triggered will stop the program. It also has an errors queue to communicate
     errors to the main thread.
 
-    It contains a timer thread `timer` connected to a dummy function which must
-    be redefined. New thread timers should be created with the `create_timer`
-    method.
+    It contains a timer thread `timer` which target must be given by the
+    `init_worker` method. New thread timers should be created with the
+    `create_timer` method.
 
     It behaves like a context manager that gives itself on enter. On exit, it
     cancels and ends its timer thread and also triggers the stop event.
@@ -339,39 +600,41 @@ class WorkerSafeTimer(BaseWorker):
     Extra actions for context manager enter and exit should be put in the
     `enter_worker` and `exit_worker` methods.
 
-    Initialization must be performed through the `init_worker` method.  The
-    initialization assigns its own timer thread to the instance and makes it
-    target a dummy method.
+    Initialization must be performed through the `init_worker` method. This
+    method returns the target of the timer thread of the instance, or assigns
+    the timer thread itself. The timer thread is created with no delay.
 
     Attributes:
         stop (threading.Event): Stop event that notify to stop the entire
             program when set.
-        errors (queue.Queue): Error queue to communicate the exception to the
-            main thread.
-        timer (SafeTimer): Timer thread that must be redefined.
+        errors (queue.Queue or ErrorSlot): Error queue to communicate the
+            exception to the main thread.
+        timer (SafeTimer): Timer thread of the worker.
 
     Args:
         stop (threading.Event): Stop event that notify to stop the entire
             program when set.
-        errors (queue.Queue): Error queue to communicate the exception to the
-            main thread.
+        errors (queue.Queue or ErrorSlot): Error queue to communicate the
+            exception to the main thread.
     """
 
+    __slots__ = ("timer",)
+
     def __init__(self, stop, errors, *args, **kwargs):
         super().__init__(stop, errors)
 
-        # create timer for itself
-        def redefine_me():
-            """Dummy function that should not be used."""
+        # perform other custom actions, which give the target of the timer
+        target = self.init_worker(*args, **kwargs)
+
+        # create timer for itself, if not created by the custom actions
+        if target is not None:
+            self.timer = self.create_timer(0, target)
+
+        elif not hasattr(self, "timer"):
             raise UnredefinedTimerError(
                 "You must redefine the timer of a WorkerSafeTimer"
             )
 
-        self.timer = self.create_timer(0, redefine_me)
-
-        # perform other custom actions
-        self.init_worker(*args, **kwargs)
-
     def __exit__(self, *args, **kwargs):
         """Worker context manager exit.
 
@@ -386,11 +649,14 @@ class WorkerSafeTimer(BaseWorker):
         if not self.timer.is_alive():
             return
 
-        logger.debug(
-            "Closing worker safe timer thread '%s' (%s)",
-            self.timer.name,
-            self.__class__.__name__,
-        )
+        # the messages are only built if debug logging is enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "Closing worker safe timer thread '%s' (%s)",
+                self.timer.name,
+                self.__class__.__name__,
+            )
 
         # custom exit
         self.exit_worker(*args, **kwargs)
@@ -401,11 +667,12 @@ class WorkerSafeTimer(BaseWorker):
         # wait for termination, if the timer was running
         self.timer.join()
 
-        logger.debug(
-            "Closed worker safe timer thread '%s' (%s)",
-            self.timer.name,
-            self.__class__.__name__,
-        )
+        if debug:
+            logger.debug(
+                "Closed worker safe timer thread '%s' (%s)",
+                self.timer.name,
+                self.__class__.__name__,
+            )
 
 
 class WorkerSafeThread(BaseWorker):
@@ -415,8 +682,9 @@ class WorkerSafeThread(BaseWorker):
     triggered will stop the program. It also has an errors queue to communicate
     errors to the main thread.
 
-    It contains a thread `thread` connected to a dummy function which must de
-    redefined. New threads should be created with the `create_thread` method.
+    It contains a thread `thread` which target must be given by the
+    `init_worker` method. New threads should be created with the
+    `create_thread` method.
 
     The instance is a context manager that gives itself on enter. On exit, it
     ends its own thread and also triggers the stop event.
@@ -424,39 +692,41 @@ class WorkerSafeThread(BaseWorker):
     Extra actions for context manager enter and exit should be put in the
     `enter_worker` and `exit_worker` methods.
 
-    Initialisation must be performed through the `init_worker` method. The
-    initialization assigns its own thread to the instance and makes it target a
-    dummy method.
+    Initialisation must be performed through the `init_worker` method. This
+    method returns the target of the thread of the instance, or assigns the
+    thread itself.
 
     Attributes:
         stop (threading.Event): Stop event that notify to stop the entire
             program when set.
-        errors (queue.Queue): Error queue to communicate the exception to the
-            main thread.
-        thread (SafeThread): Thread bound to the `run` method.
+        errors (queue.Queue or ErrorSlot): Error queue to communicate the
+            exception to the main thread.
+        thread (SafeThread): Thread of the worker.
 
     Args:
         stop (threading.Event): Stop event that notify to stop the entire
             program when set.
-        errors (queue.Queue): Error queue to communicate the exception to the
-            main thread.
+        errors (queue.Queue or ErrorSlot): Error queue to communicate the
+            exception to the main thread.
     """
 
+    __slots__ = ("thread",)
+
     def __init__(self, stop, errors, *args, **kwargs):
         super().__init__(stop, errors)
 
-        # create thread for itself
-        def redefine_me():
-            """Dummy function that should not be used."""
+        # perform other custom actions, which give the target of the thread
+        target = self.init_worker(*args, **kwargs)
+
+        # create thread for itself, if not created by the custom actions
+        if target is not None:
+            self.thread = self.create_thread(target=target)
+
+        elif not hasattr(self, "thread"):
             raise UnredefinedThreadError(
                 "You must redefine the thread of a WorkerSafeThread"
             )
 
-        self.thread = self.create_thread(target=redefine_me)
-
-        # perform other custom actions
-        self.init_worker(*args, **kwargs)
-
     def __exit__(self, *args, **kwargs):
         """Worker context manager exit.
 
@@ -470,11 +740,14 @@ class WorkerSafeThread(BaseWorker):
         if not self.thread.is_alive():
             return
 
-        logger.debug(
-            "Closing worker safe thread '%s' (%s)",
-            self.thread.name,
-            self.__class__.__name__,
-        )
+        # the messages are only built if debug logging is enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "Closing worker safe thread '%s' (%s)",
+                self.thread.name,
+                self.__class__.__name__,
+            )
 
         # custom exit action
         self.exit_worker(*args, **kwargs)
@@ -482,44 +755,60 @@ class WorkerSafeThread(BaseWorker):
         # wait for termination
         self.thread.join()
 
-        logger.debug(
-            "Closed worker safe thread '%s' (%s)",
-            self.thread.name,
-            self.__class__.__name__,
-        )
+        if debug:
+            logger.debug(
+                "Closed worker safe thread '%s' (%s)",
+                self.thread.name,
+                self.__class__.__name__,
+            )
 
 
 class Runner:
     """Runner class.
 
-    The runner creates the stop event and errors queue. It is designed to
+    The runner creates the stop event and errors slot. It is designed to
     execute the thread of a `WorkerSafeThread` instance until an error occurs
     or an user interruption pops out (Ctrl+C).
 
-    The initialization creates the stop event and the errors queue and calls
+    The initialization creates the stop event and the errors slot and calls
     the custom init method.
 
     Attributes:
-        POLLING_INTERVAL (float): For Windows only, interval between two
-            attempts to wait for the stop event.
         stop (threading.Event): Stop event that notify to stop the execution of
             the thread.
-        errors (queue.Queue): Error queue to communicate the exception of the
+        errors (ErrorSlot): Error slot to communicate the exception of the
             thread.
+        interrupted (threading.Event): Event set when the execution has been
+            stopped by the user (Ctrl+C).
+
+    Raises:
+        TypeError: If the stop event or the errors slot have been replaced by
+            objects of invalid type in the custom init method.
     """
 
-    POLLING_INTERVAL = 0.5
+    __slots__ = ("stop", "errors", "interrupted")
 
     def __init__(self, *args, **kwargs):
         # create stop event
         self.stop = Event()
 
-        # create errors queue
-        self.errors = Queue()
+        # create user interruption event
+        self.interrupted = Event()
+
+        # create errors slot
+        self.errors = ErrorSlot()
 
         # extra actions
         self.init_runner(*args, **kwargs)
 
+        # check the stop event and errors slot, as they are passed as is to
+        # the workers, which do not check them
+        if not isinstance(self.stop, Event):
+            raise TypeError("Stop attribute must be of type Event")
+
+        if not isinstance(self.errors, ERRORS_CLASSES):
+            raise TypeError("Errors attribute must be of type Queue or ErrorSlot")
+
     def init_runner(self, *args, **kwargs):
         """Custom initialization stub."""
         pass
@@ -535,7 +824,17 @@ class Runner:
                 Note you have to pass a custom class based on
                 `WorkerSafeThread`.
             Other arguments are passed to the thread of WorkerClass.
+
+        Raises:
+            TypeError: If the worker class is not a BaseWorker class.
         """
+        # check the worker class once, as it comes from the caller
+        if not (isinstance(WorkerClass, type) and issubclass(WorkerClass, BaseWorker)):
+            raise TypeError(
+                f"The worker class '{getattr(WorkerClass, '__name__', WorkerClass)}' "
+                "is not a BaseWorker"
+            )
+
         try:
             # create worker thread
             with WorkerClass(self.stop, self.errors, *args, **kwargs) as worker:
@@ -545,59 +844,50 @@ class Runner:
 
                 # wait for stop event
                 logger.debug("Waiting for stop event")
-
-                # We have to use a different code for Windows because the
-                # Ctrl+C event will not be handled during `self.stop.wait()`.
-                # This method is blocking for Windows, not for Linux, which is
-                # due to the way Ctrl+C is differently handled by the two OSs.
-                # For Windows, a quick and dirty solution consists in polling
-                # the `self.stop.wait()` with a timeout argument, so the call
-                # is non-permanently blocking.
-                # More resources on this:
-                # https://mail.python.org/pipermail/python-dev/2017-August/148800.html
-                # https://stackoverflow.com/a/51954792/4584444
-                if sys.platform.startswith("win"):
-                    while not self.stop.is_set():
-                        self.stop.wait(self.POLLING_INTERVAL)
-
-                else:
-                    self.stop.wait()
+                wait(self.stop)
 
         # stop on Ctrl+C
         except KeyboardInterrupt:
             logger.debug("User stop caught")
+            self.interrupted.set()
             self.stop.set()
 
         # stop on error
         else:
             logger.debug("Internal error caught")
 
-            # get the error from the error queue and re-raise it
-            # a delay of 5 seconds is accorded for the error to be retrieved
-            try:
-                _, error, traceback = self.errors.get(5)
-                error.with_traceback(traceback)
-                raise error
+            # get all the errors from the error slot and re-raise the first one
+            # the error is put before the stop event is set, so it is already
+            # there
+            errors = drain_errors(self.errors)
+
+            # if there is no error in the error slot, raise a general error
+            # this happens if the stop event has been set without error
+            if not errors:
+                raise NoErrorCaughtError("Unknown error happened")
+
+            if len(errors) > 1:
+                logger.debug(
+                    "%i errors caught, only the first one is raised", len(errors)
+                )
 
-            # if there is no error in the error queue, raise a general error
-            # this case is very unlikely to happen and is not tested
-            except Empty as empty_error:
-                raise NoErrorCaughtError("Unknown error happened") from empty_error
+            # the error carries its own traceback
+            raise errors[0]
 
 
 class UnredefinedTimerError(DakaraError):
     """Unredefined timer error.
 
-    Error raised if the default timer of the `WorkerSafeTimer` class has not
-    been redefined.
+    Error raised on creation of a `WorkerSafeTimer` instance if its timer has
+    not been defined.
     """
 
 
 class UnredefinedThreadError(DakaraError):
     """Unredefined thread error.
 
-    Error raised if the default thread of the `WorkerSafeTimer` class has not
-    been redefined.
+    Error raised on creation of a `WorkerSafeThread` instance if its thread
+    has not been defined.
     """
 
 
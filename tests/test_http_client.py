@@ -1,17 +1,42 @@
-from unittest import TestCase
-from unittest.mock import ANY, MagicMock, patch
+import asyncio
+import json
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import IsolatedAsyncioTestCase, TestCase, skipIf
+from unittest.mock import MagicMock, patch
 
-from requests.exceptions import RequestException
+from requests import Session
+from requests.adapters import HTTPAdapter
+from requests.exceptions import JSONDecodeError, RequestException
+from urllib3 import HTTPResponse
+
+try:
+    from aiohttp import ClientTimeout, web
+    from aiohttp.test_utils import TestServer
+
+except ImportError:
+    ClientTimeout = TestServer = web = None
+
+try:
+    from requests_cache import CachedSession
+
+except ImportError:
+    CachedSession = None
 
 from dakara_base.http_client import (
+    AsyncHTTPClient,
     AuthenticationError,
     HTTPClient,
     MethodError,
+    MissingDependencyError,
     NotAuthenticatedError,
     ParameterError,
     ResponseInvalidError,
     ResponseRequestError,
     authenticated,
+    create_cache_key,
+    join_url,
 )
 
 
@@ -45,6 +70,36 @@ class AuthenticatedTestCase(TestCase):
             instance.dummy()
 
 
+class JoinUrlTestCase(TestCase):
+    """Test the `join_url` function."""
+
+    def setUp(self):
+        # empty the cache
+        join_url.cache_clear()
+
+    def test_join(self):
+        """Test to join an endpoint to a server URL."""
+        self.assertEqual(
+            join_url("http://www.example.com/api/", "endpoint/"),
+            "http://www.example.com/api/endpoint/",
+        )
+        self.assertEqual(
+            join_url("http://www.example.com", "endpoint/"),
+            "http://www.example.com/endpoint/",
+        )
+
+    def test_join_cached(self):
+        """Test that joined URLs are cached."""
+        join_url("http://www.example.com/api/", "endpoint/")
+        join_url("http://www.example.com/api/", "endpoint/")
+        join_url("http://www.example.com/api/", "other/")
+
+        # assert the cache
+        cache_info = join_url.cache_info()
+        self.assertEqual(cache_info.hits, 1)
+        self.assertEqual(cache_info.misses, 2)
+
+
 class HTTPClientTestCase(TestCase):
     """Test the HTTP connection with a server."""
 
@@ -89,6 +144,146 @@ class HTTPClientTestCase(TestCase):
         self.assertEqual(self.client.login, self.login)
         self.assertEqual(self.client.password, self.password)
         self.assertIsNone(self.client.token)
+        self.assertNotIn("Authorization", self.client._session.headers)
+
+    def test_init_token(self):
+        """Test to create object with a token."""
+        client = HTTPClient({"url": self.url, "token": self.token})
+
+        # assert the session header
+        self.assertEqual(client.token, self.token)
+        self.assertEqual(
+            client._session.headers["Authorization"], "Token " + self.token
+        )
+
+    def test_init_pool(self):
+        """Test to create object with custom connection pool size."""
+        client = HTTPClient(
+            {"url": self.url, "pool_connections": 5, "pool_maxsize": 20},
+            endpoint_prefix="api/",
+        )
+
+        # assert the adapters
+        for prefix in ("http://", "https://"):
+            adapter = client._session.get_adapter(prefix)
+            self.assertEqual(adapter._pool_connections, 5)
+            self.assertEqual(adapter._pool_maxsize, 20)
+            self.assertEqual(adapter.max_retries.total, 3)
+
+    def test_init_pool_max_workers(self):
+        """Test the connection pool is large enough for the executor."""
+        client = HTTPClient(
+            {"url": self.url, "pool_maxsize": 20, "max_workers": 30},
+            endpoint_prefix="api/",
+        )
+
+        # assert the adapter
+        self.assertEqual(client._session.get_adapter("http://")._pool_maxsize, 30)
+        self.assertEqual(client._executor._max_workers, 30)
+
+    @skipIf(CachedSession is None, "requests-cache is not installed")
+    def test_init_cache(self):
+        """Test to create object with a cache."""
+        with TemporaryDirectory() as tempdir:
+            cache_path = Path(tempdir) / "cache"
+            client = HTTPClient(
+                {
+                    "url": self.url,
+                    "token": self.token,
+                    "cache": True,
+                    "cache_path": cache_path,
+                    "cache_ttl": 10,
+                },
+                endpoint_prefix="api/",
+            )
+
+            # assert the session
+            self.assertIsInstance(client._session, CachedSession)
+            self.assertEqual(client._session.settings.expire_after, 10)
+            self.assertEqual(client._session.settings.allowable_methods, ("GET",))
+            self.assertEqual(
+                client._session.headers["Authorization"], "Token " + self.token
+            )
+            self.assertIs(client._session.settings.key_fn, create_cache_key)
+            self.assertIsNotNone(client._session.get_adapter("http://").max_retries)
+
+            client.close()
+
+    @skipIf(CachedSession is None, "requests-cache is not installed")
+    @patch("dakara_base.http_client.directories")
+    def test_init_cache_default_path(self, mocked_directories):
+        """Test the default cache file is specific to the server URL."""
+        with TemporaryDirectory() as tempdir:
+            mocked_directories.user_cache_path = Path(tempdir)
+            client_api = HTTPClient(
+                {"url": self.url, "cache": True}, endpoint_prefix="api/"
+            )
+            client_other = HTTPClient(
+                {"url": self.url, "cache": True}, endpoint_prefix="other/"
+            )
+
+            # assert the cache files
+            self.assertNotEqual(
+                client_api._session.cache.db_path, client_other._session.cache.db_path
+            )
+            for client in (client_api, client_other):
+                self.assertEqual(
+                    Path(client._session.cache.db_path).parent, Path(tempdir)
+                )
+                client.close()
+
+    @skipIf(CachedSession is None, "requests-cache is not installed")
+    @patch.object(HTTPAdapter, "send", autospec=True)
+    def test_get_cache_token(self, mocked_send):
+        """Test cached responses are not shared between tokens."""
+
+        def send(adapter, request, **kwargs):
+            content = json.dumps({"authorization": request.headers["Authorization"]})
+            raw = HTTPResponse(
+                body=BytesIO(content.encode()),
+                headers={"Content-Type": "application/json"},
+                status=200,
+                preload_content=False,
+                request_url=request.url,
+            )
+            return adapter.build_response(request, raw)
+
+        mocked_send.side_effect = send
+
+        with TemporaryDirectory() as tempdir:
+            config = {
+                "url": self.url,
+                "cache": True,
+                "cache_path": Path(tempdir) / "cache",
+            }
+            client = HTTPClient({**config, "token": "first"}, endpoint_prefix="api/")
+            client_other = HTTPClient(
+                {**config, "token": "second"}, endpoint_prefix="api/"
+            )
+
+            # call the methods
+            data_first = client.get("endpoint/")
+            data_first_cached = client.get("endpoint/")
+            data_second = client_other.get("endpoint/")
+
+            # assert the responses
+            self.assertEqual(data_first, {"authorization": "Token first"})
+            self.assertEqual(data_first_cached, data_first)
+            self.assertEqual(data_second, {"authorization": "Token second"})
+            self.assertEqual(mocked_send.call_count, 2)
+
+            client.close()
+            client_other.close()
+
+    @patch("dakara_base.http_client.requests_cache", None)
+    def test_init_cache_missing_dependency(self):
+        """Test to create object with a cache when requests-cache is missing."""
+        with self.assertRaises(MissingDependencyError):
+            HTTPClient({"url": self.url, "cache": True}, endpoint_prefix="api/")
+
+    def test_init_no_cache(self):
+        """Test to create object without cache."""
+        self.assertIs(type(self.client._session), Session)
 
     def test_load_missing_key(self):
         """Test to create object with missing mandatory key."""
@@ -102,8 +297,8 @@ class HTTPClientTestCase(TestCase):
         ):
             client.load()
 
-    @patch("dakara_base.http_client.requests.post", autospec=True)
-    def test_send_request_raw_successful(self, mocked_post):
+    @patch.object(Session, "request", autospec=True)
+    def test_send_request_raw_successful(self, mocked_request):
         """Test to send a raw request with the generic method."""
         # call the method
         with self.assertLogs("dakara_base.http_client", "DEBUG") as logger:
@@ -124,8 +319,11 @@ class HTTPClientTestCase(TestCase):
         )
 
         # assert the call
-        mocked_post.assert_called_with(
-            "http://www.example.com/api/endpoint/", data={"content": "test"}
+        mocked_request.assert_called_with(
+            self.client._session,
+            "post",
+            "http://www.example.com/api/endpoint/",
+            data={"content": "test"},
         )
 
     def test_send_request_raw_error_method(self):
@@ -139,11 +337,21 @@ class HTTPClientTestCase(TestCase):
                 message_on_error="error message",
             )
 
-    @patch("dakara_base.http_client.requests.post", autospec=True)
-    def test_send_request_raw_error_request(self, mocked_post):
+    @patch.object(Session, "request", autospec=True)
+    def test_send_request_raw_error_method_not_verb(self, mocked_request):
+        """Test that a non HTTP method name fails for a generic raw request."""
+        # call the method
+        with self.assertRaises(MethodError):
+            self.client.send_request_raw("session", "endpoint/")
+
+        # assert the call
+        mocked_request.assert_not_called()
+
+    @patch.object(Session, "request", autospec=True)
+    def test_send_request_raw_error_request(self, mocked_request):
         """Test to send a raw request when there is a communication error."""
         # mock the response of the server
-        mocked_post.side_effect = RequestException("error")
+        mocked_request.side_effect = RequestException("error")
 
         # call the method
         with self.assertLogs("dakara_base.http_client", "DEBUG") as logger:
@@ -167,23 +375,40 @@ class HTTPClientTestCase(TestCase):
             ],
         )
 
-    @patch("dakara_base.http_client.requests.post", autospec=True)
-    def test_send_request_raw_error_response(self, mocked_post):
+    @patch.object(Session, "request", autospec=True)
+    def test_send_request_raw_error_response(self, mocked_request):
         """Test to send a raw request when the response is invalid."""
         # mock the response of the server
-        mocked_post.return_value.ok = False
+        mocked_request.return_value.ok = False
 
         # call the method
         with self.assertLogs("dakara_base.http_client", "DEBUG"):
             with self.assertRaises(ResponseInvalidError):
                 self.client.send_request_raw("post", "endpoint/")
 
-    @patch("dakara_base.http_client.requests.post", autospec=True)
-    def test_send_request_raw_error_response_custom(self, mocked_post):
+    @patch("dakara_base.http_client.truncate_message", autospec=True)
+    @patch.object(Session, "request", autospec=True)
+    def test_send_request_raw_error_response_no_debug(
+        self, mocked_request, mocked_truncate_message
+    ):
+        """Test the response is not truncated for logs if debug is disabled."""
+        # mock the response of the server
+        mocked_request.return_value.ok = False
+
+        # call the method
+        with self.assertLogs("dakara_base.http_client", "INFO"):
+            with self.assertRaises(ResponseInvalidError):
+                self.client.send_request_raw("post", "endpoint/")
+
+        # assert the call
+        mocked_truncate_message.assert_not_called()
+
+    @patch.object(Session, "request", autospec=True)
+    def test_send_request_raw_error_response_custom(self, mocked_request):
         """Test to send a raw request when the response is invalid and an
         error function given."""
         # mock the response of the server
-        mocked_post.return_value.ok = False
+        mocked_request.return_value.ok = False
 
         # create error exception and error function
         class MyError(Exception):
@@ -210,13 +435,24 @@ class HTTPClientTestCase(TestCase):
 
         # assert the call
         mocked_send_request_raw.assert_called_with(
-            self.client,
-            "post",
-            "endpoint/",
-            headers={"Authorization": "Token token value"},
-            json={"key": "value"},
+            self.client, "post", "endpoint/", json={"key": "value"}
+        )
+
+        # assert the session header
+        self.assertEqual(
+            self.client._session.headers["Authorization"], "Token token value"
         )
 
+    @patch.object(HTTPClient, "send_request_raw", autospec=True)
+    def test_send_request_not_authenticated(self, mocked_send_request_raw):
+        """Test to send a request when not authenticated."""
+        # call the method
+        with self.assertRaises(NotAuthenticatedError):
+            self.client.send_request("post", "endpoint/", json={"key": "value"})
+
+        # assert the call
+        mocked_send_request_raw.assert_not_called()
+
     @patch.object(HTTPClient, "send_request_raw", autospec=True)
     def test_send_request_error_raised(self, mocked_send_request_raw):
         """Test to send an unsuccessful request which is not muted."""
@@ -246,48 +482,131 @@ class HTTPClientTestCase(TestCase):
         # assert the response is None
         self.assertIsNone(response)
 
-    @patch("dakara_base.http_client.requests.delete", autospec=True)
-    @patch("dakara_base.http_client.requests.patch", autospec=True)
-    @patch("dakara_base.http_client.requests.put", autospec=True)
-    @patch("dakara_base.http_client.requests.post", autospec=True)
-    @patch("dakara_base.http_client.requests.get", autospec=True)
-    def test_methods(
-        self, mocked_get, mocked_post, mocked_put, mocked_patch, mocked_delete
-    ):
+    @patch.object(Session, "request", autospec=True)
+    def test_methods(self, mocked_request):
         """Test the different HTTP methods."""
         # set the token
         self.set_token()
 
         # mock the response
-        response = MagicMock()
-        response.json.return_value = "data"
-        mocked_get.return_value = response
-        mocked_post.return_value = response
-        mocked_put.return_value = response
-        mocked_patch.return_value = response
-        mocked_delete.return_value = response
+        mocked_request.return_value.content = b'"data"'
 
         for method in ("get", "post", "put", "patch", "delete"):
             # call the method
-
             response_obtained = getattr(self.client, method)("endpoint/")
 
             # assert the result
             self.assertEqual(response_obtained, "data")
 
-        # assert the calls
-        mocked_get.assert_called_with(self.url_endpoint, headers=ANY)
-        mocked_post.assert_called_with(self.url_endpoint, headers=ANY)
-        mocked_put.assert_called_with(self.url_endpoint, headers=ANY)
-        mocked_patch.assert_called_with(self.url_endpoint, headers=ANY)
-        mocked_delete.assert_called_with(self.url_endpoint, headers=ANY)
+            # assert the call
+            mocked_request.assert_called_with(
+                self.client._session, method, self.url_endpoint
+            )
+
+    @patch.object(HTTPClient, "send_request", autospec=True)
+    def test_methods_send_request(self, mocked_send_request):
+        """Test the HTTP methods use the send request method."""
+        # mock the response
+        mocked_send_request.return_value.content = b'"data"'
 
-    @patch("dakara_base.http_client.requests.post", autospec=True)
-    def test_authenticate_successful(self, mocked_post):
+        for method in ("get", "post", "put", "patch", "delete"):
+            # call the method
+            response_obtained = getattr(self.client, method)(
+                "endpoint/", json={"key": "value"}
+            )
+
+            # assert the result
+            self.assertEqual(response_obtained, "data")
+
+            # assert the call
+            mocked_send_request.assert_called_with(
+                self.client, method, "endpoint/", json={"key": "value"}
+            )
+
+    @patch.object(HTTPClient, "get", autospec=True)
+    def test_get_many(self, mocked_get):
+        """Test to get several endpoints concurrently."""
+        # mock the response
+        mocked_get.side_effect = lambda client, endpoint, **kwargs: endpoint
+
+        # call the method
+        responses = self.client.get_many(
+            ["endpoint/", "other/", "another/"], message_on_error="error message"
+        )
+
+        # assert the result
+        self.assertListEqual(responses, ["endpoint/", "other/", "another/"])
+
+        # assert the call
+        mocked_get.assert_any_call(
+            self.client, "other/", message_on_error="error message"
+        )
+
+    @patch.object(HTTPClient, "get", autospec=True)
+    def test_get_many_error(self, mocked_get):
+        """Test to get several endpoints concurrently with an error."""
+        # mock the response
+        mocked_get.side_effect = ResponseInvalidError("invalid")
+
+        # call the method
+        with self.assertRaises(ResponseInvalidError):
+            self.client.get_many(["endpoint/", "other/"])
+
+    @patch.object(HTTPClient, "send_request_raw", autospec=True)
+    def test_methods_error_muted(self, mocked_send_request_raw):
+        """Test the different HTTP methods with a muted error."""
+        # set the token
+        self.set_token()
+        self.set_mute()
+
+        # raise an error
+        mocked_send_request_raw.side_effect = ResponseInvalidError("invalid")
+
+        for method in ("get", "post", "put", "patch", "delete"):
+            # call the method
+            response_obtained = getattr(self.client, method)("endpoint/")
+
+            # assert the result
+            self.assertIsNone(response_obtained)
+
+    @patch.object(HTTPClient, "send_request_raw", autospec=True)
+    def test_methods_not_authenticated(self, mocked_send_request_raw):
+        """Test the different HTTP methods when not authenticated."""
+        for method in ("get", "post", "put", "patch", "delete"):
+            # call the method
+            with self.assertRaises(NotAuthenticatedError):
+                getattr(self.client, method)("endpoint/")
+
+        # assert the call
+        mocked_send_request_raw.assert_not_called()
+
+    @patch.object(Session, "request", autospec=True)
+    def test_send_request_raw_method_case(self, mocked_request):
+        """Test that the method name is case insensitive."""
+        # call the method
+        self.client.send_request_raw("GET", "endpoint/")
+
+        # assert the call
+        mocked_request.assert_called_with(
+            self.client._session, "get", self.url_endpoint
+        )
+
+    @patch.object(Session, "close", autospec=True)
+    def test_context_manager(self, mocked_close):
+        """Test the client closes its session on context manager exit."""
+        with self.client as client:
+            self.assertIs(client, self.client)
+            mocked_close.assert_not_called()
+
+        # assert the call
+        mocked_close.assert_called_once_with(self.client._session)
+
+    @patch.object(Session, "request", autospec=True)
+    def test_authenticate_successful(self, mocked_request):
         """Test a successful authentication with the server."""
         # mock the response of the server
-        mocked_post.return_value.ok = True
-        mocked_post.return_value.json.return_value = {"token": self.token}
+        mocked_request.return_value.ok = True
+        mocked_request.return_value.content = b'{"token": "token value"}'
 
         # pre assertions
         self.assertIsNone(self.client.token)
@@ -297,13 +616,19 @@ class HTTPClientTestCase(TestCase):
             self.client.authenticate()
 
         # call assertions
-        mocked_post.assert_called_with(
-            self.url_login, json={"login": self.login, "password": self.password}
+        mocked_request.assert_called_with(
+            self.client._session,
+            "post",
+            self.url_login,
+            json={"login": self.login, "password": self.password},
         )
 
         # post assertions
         self.assertIsNotNone(self.client.token)
         self.assertEqual(self.client.token, self.token)
+        self.assertEqual(
+            self.client._session.headers["Authorization"], "Token " + self.token
+        )
 
         # assert effect on logger
         self.assertListEqual(
@@ -317,8 +642,8 @@ class HTTPClientTestCase(TestCase):
             ],
         )
 
-    @patch("dakara_base.http_client.requests.post", autospec=True)
-    def test_authenticate_token_present(self, mocked_post):
+    @patch.object(Session, "request", autospec=True)
+    def test_authenticate_token_present(self, mocked_request):
         """Test to bypass authentication with already present token."""
         # create token
         self.client.token = self.token
@@ -327,41 +652,41 @@ class HTTPClientTestCase(TestCase):
         self.client.authenticate()
 
         # call assertions
-        mocked_post.assert_not_called()
+        mocked_request.assert_not_called()
 
         # post assertions
         self.assertEqual(self.client.token, self.token)
 
-    @patch("dakara_base.http_client.requests.post", autospec=True)
-    def test_authenticate_error_network(self, mocked_post):
+    @patch.object(Session, "request", autospec=True)
+    def test_authenticate_error_network(self, mocked_request):
         """Test a network error when authenticating."""
         # mock the response of the server
-        mocked_post.side_effect = RequestException()
+        mocked_request.side_effect = RequestException()
 
         # call the method
         with self.assertRaises(ResponseRequestError):
             with self.assertLogs("dakara_base.http_client", "DEBUG"):
                 self.client.authenticate()
 
-    @patch("dakara_base.http_client.requests.post", autospec=True)
-    def test_authenticate_error_authentication(self, mocked_post):
+    @patch.object(Session, "request", autospec=True)
+    def test_authenticate_error_authentication(self, mocked_request):
         """Test an authentication error when authenticating."""
         # mock the response of the server
-        mocked_post.return_value.ok = False
-        mocked_post.return_value.status_code = 400
+        mocked_request.return_value.ok = False
+        mocked_request.return_value.status_code = 400
 
         # call the method
         with self.assertRaises(AuthenticationError):
             with self.assertLogs("dakara_base.http_client", "DEBUG"):
                 self.client.authenticate()
 
-    @patch("dakara_base.http_client.requests.post", autospec=True)
-    def test_authenticate_error_other(self, mocked_post):
+    @patch.object(Session, "request", autospec=True)
+    def test_authenticate_error_other(self, mocked_request):
         """Test a server error when authenticating."""
         # mock the response of the server
-        mocked_post.return_value.ok = False
-        mocked_post.return_value.status_code = 999
-        mocked_post.return_value.test = "error"
+        mocked_request.return_value.ok = False
+        mocked_request.return_value.status_code = 999
+        mocked_request.return_value.test = "error"
 
         # call the method
         with self.assertRaises(AuthenticationError):
@@ -379,19 +704,22 @@ class HTTPClientTestCase(TestCase):
         # call assertions
         self.assertEqual(result, {"Authorization": "Token " + self.token})
 
+    def test_get_token_header_not_authenticated(self):
+        """Test the helper to get token header when not authenticated."""
+        with self.assertRaises(NotAuthenticatedError):
+            self.client.get_token_header()
+
     def test_get_json_from_response(self):
         """Test the helper to get data from existing response."""
         # create the mock
         response = MagicMock()
+        response.content = b'{"key": "value"}'
 
         # call the method
         result = HTTPClient.get_json_from_response(response)
 
-        # assert the result is not None
-        self.assertIsNotNone(result)
-
-        # assert the call
-        response.json.assert_called_with()
+        # assert the result
+        self.assertEqual(result, {"key": "value"})
 
     def test_get_json_from_response_none(self):
         """Test the helper to get data from no response."""
@@ -405,11 +733,296 @@ class HTTPClientTestCase(TestCase):
         """Test the helper to get data from a response with no content."""
         # create a response with no content
         response = MagicMock()
-        response.text = ""
-        response.json.side_effect = Exception("error")
+        response.content = b""
 
         # call the method
         result = HTTPClient.get_json_from_response(response)
 
         # assert the result is None
         self.assertIsNone(result)
+
+    def test_get_json_from_response_invalid(self):
+        """Test the helper to get data from a response with invalid JSON."""
+        # create the mock
+        response = MagicMock()
+        response.content = b"<html></html>"
+
+        # call the method
+        with self.assertRaises(JSONDecodeError):
+            HTTPClient.get_json_from_response(response)
+
+    @patch("dakara_base.http_client.json_loads", wraps=json.loads)
+    def test_get_json_from_response_loads(self, mocked_json_loads):
+        """Test the helper parses the raw content of the response."""
+        # create the mock
+        response = MagicMock()
+        response.content = b'{"key": "value"}'
+
+        # call the method
+        result = HTTPClient.get_json_from_response(response)
+
+        # assert the result
+        self.assertEqual(result, {"key": "value"})
+
+        # assert the call
+        mocked_json_loads.assert_called_with(b'{"key": "value"}')
+
+
+@skipIf(web is None, "aiohttp is not installed")
+class AsyncHTTPClientTestCase(IsolatedAsyncioTestCase):
+    """Test the asynchronous HTTP connection with a server."""
+
+    async def asyncSetUp(self):
+        # create a token
+        self.token = "token value"
+
+        # create a login and password
+        self.login = "test"
+        self.password = "test"
+
+        # create a server
+        self.requests = []
+        app = web.Application()
+        app.router.add_route("*", "/api/endpoint/", self.handle_endpoint)
+        app.router.add_route("*", "/api/empty/", self.handle_empty)
+        app.router.add_route("*", "/api/error/", self.handle_error)
+        app.router.add_route("*", "/api/slow/", self.handle_slow)
+        app.router.add_post("/api/accounts/login/", self.handle_login)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+        # create a server URL
+        self.url = str(self.server.make_url(""))
+
+        # create a client
+        self.client = AsyncHTTPClient(
+            {"url": self.url, "login": self.login, "password": self.password},
+            endpoint_prefix="api/",
+        )
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.server.close()
+
+    async def handle_endpoint(self, request):
+        self.requests.append(request)
+        return web.json_response({"method": request.method})
+
+    async def handle_empty(self, request):
+        self.requests.append(request)
+        return web.Response()
+
+    async def handle_error(self, request):
+        self.requests.append(request)
+        return web.Response(status=500, text="error")
+
+    async def handle_slow(self, request):
+        self.requests.append(request)
+        await asyncio.sleep(1)
+        return web.Response()
+
+    async def handle_login(self, request):
+        self.requests.append(request)
+        data = await request.json()
+        if data != {"login": self.login, "password": self.password}:
+            return web.Response(status=400)
+
+        return web.json_response({"token": self.token})
+
+    def set_token(self):
+        """Set the token to the test client."""
+        self.client.token = self.token
+
+    async def test_send_request_raw_successful(self):
+        """Test to send a raw request with the generic method."""
+        # call the method
+        with self.assertLogs("dakara_base.http_client", "DEBUG") as logger:
+            response = await self.client.send_request_raw("post", "endpoint/")
+
+        # assert the response
+        self.assertEqual(response.status, 200)
+        self.assertEqual(await response.json(), {"method": "POST"})
+
+        # assert the effect on logger
+        self.assertListEqual(
+            logger.output,
+            [
+                "DEBUG:dakara_base.http_client:"
+                "Sending POST request to {}/api/endpoint/".format(self.url)
+            ],
+        )
+
+    async def test_send_request_raw_error_method(self):
+        """Test that a wrong method name fails for a generic raw request."""
+        with self.assertRaises(MethodError):
+            await self.client.send_request_raw("invalid", "endpoint/")
+
+    async def test_send_request_raw_error_request(self):
+        """Test to send a raw request when there is a communication error."""
+        # stop the server
+        await self.server.close()
+
+        # call the method
+        with self.assertLogs("dakara_base.http_client", "DEBUG"):
+            with self.assertRaisesRegex(
+                ResponseRequestError, "Error when communicating with the server"
+            ):
+                await self.client.send_request_raw(
+                    "post", "endpoint/", message_on_error="error message"
+                )
+
+    async def test_send_request_raw_error_timeout(self):
+        """Test to send a raw request when the server takes too long."""
+        with self.assertLogs("dakara_base.http_client", "DEBUG") as logger:
+            with self.assertRaisesRegex(
+                ResponseRequestError, "Error when communicating with the server"
+            ):
+                await self.client.send_request_raw(
+                    "get",
+                    "slow/",
+                    message_on_error="error message",
+                    timeout=ClientTimeout(total=0.05),
+                )
+
+        # assert the effect on logger
+        self.assertIn(
+            "ERROR:dakara_base.http_client:error message, communication error",
+            logger.output,
+        )
+
+    async def test_send_request_raw_error_response(self):
+        """Test to send a raw request when the response is invalid."""
+        with self.assertLogs("dakara_base.http_client", "DEBUG"):
+            with self.assertRaisesRegex(ResponseInvalidError, "Error 500"):
+                await self.client.send_request_raw("get", "error/")
+
+    @patch("dakara_base.http_client.truncate_message", autospec=True)
+    async def test_send_request_raw_error_response_no_debug(
+        self, mocked_truncate_message
+    ):
+        """Test the response is not truncated for logs if debug is disabled."""
+        with self.assertLogs("dakara_base.http_client", "INFO"):
+            with self.assertRaises(ResponseInvalidError):
+                await self.client.send_request_raw("get", "error/")
+
+        # assert the call
+        mocked_truncate_message.assert_not_called()
+
+    async def test_send_request_raw_error_response_custom(self):
+        """Test to send a raw request when the response is invalid and an
+        error function given."""
+
+        # create error exception and error function
+        class MyError(Exception):
+            pass
+
+        async def on_error(response):
+            return MyError(await response.text())
+
+        # call the method
+        with self.assertLogs("dakara_base.http_client", "DEBUG"):
+            with self.assertRaisesRegex(MyError, "error"):
+                await self.client.send_request_raw(
+                    "get", "error/", function_on_error=on_error
+                )
+
+    async def test_methods(self):
+        """Test the different HTTP methods."""
+        # set the token
+        self.set_token()
+
+        for method in ("get", "post", "put", "patch", "delete"):
+            # call the method
+            response_obtained = await getattr(self.client, method)("endpoint/")
+
+            # assert the result
+            self.assertEqual(response_obtained, {"method": method.upper()})
+
+        # assert the authorization header has been sent
+        for request in self.requests:
+            self.assertEqual(request.headers["Authorization"], "Token " + self.token)
+
+    async def test_methods_send_request(self):
+        """Test the HTTP methods use the send request coroutine."""
+
+        class Client(AsyncHTTPClient):
+            async def send_request(self, method, endpoint, **kwargs):
+                return await super().send_request(method, "endpoint/", **kwargs)
+
+        async with Client(
+            {"url": self.url, "token": self.token}, endpoint_prefix="api/"
+        ) as client:
+            for method in ("get", "post", "put", "patch", "delete"):
+                # call the method
+                response_obtained = await getattr(client, method)("other/")
+
+                # assert the result
+                self.assertEqual(response_obtained, {"method": method.upper()})
+
+    async def test_methods_empty(self):
+        """Test a HTTP method with an empty response."""
+        # set the token
+        self.set_token()
+
+        # call the method
+        self.assertIsNone(await self.client.get("empty/"))
+
+    async def test_methods_error_muted(self):
+        """Test a HTTP method with a muted error."""
+        # set the token
+        self.set_token()
+        self.client.mute_raise = True
+
+        # call the method
+        with self.assertLogs("dakara_base.http_client", "DEBUG"):
+            self.assertIsNone(await self.client.get("error/"))
+
+    async def test_methods_not_authenticated(self):
+        """Test a HTTP method when not authenticated."""
+        with self.assertRaises(NotAuthenticatedError):
+            await self.client.get("endpoint/")
+
+        # assert no request has been sent
+        self.assertListEqual(self.requests, [])
+
+    async def test_authenticate_successful(self):
+        """Test a successful authentication with the server."""
+        # call the method
+        with self.assertLogs("dakara_base.http_client", "DEBUG"):
+            await self.client.authenticate()
+
+        # post assertions
+        self.assertEqual(self.client.token, self.token)
+        self.assertEqual(
+            self.client.get_token_header(), {"Authorization": "Token " + self.token}
+        )
+
+        # assert the token is used for subsequent requests
+        await self.client.get("endpoint/")
+        self.assertEqual(
+            self.requests[-1].headers["Authorization"], "Token " + self.token
+        )
+
+    async def test_authenticate_error_authentication(self):
+        """Test an authentication error when authenticating."""
+        self.client.password = "wrong"
+
+        # call the method
+        with self.assertRaisesRegex(AuthenticationError, "Login to server failed"):
+            with self.assertLogs("dakara_base.http_client", "DEBUG"):
+                await self.client.authenticate()
+
+    async def test_context_manager(self):
+        """Test the client closes its session on context manager exit."""
+        # set the token
+        self.set_token()
+
+        async with self.client as client:
+            self.assertIs(client, self.client)
+            await client.get("endpoint/")
+            session = client._session
+            self.assertFalse(session.closed)
+
+        # assert the session is closed
+        self.assertTrue(session.closed)
+        self.assertIsNone(self.client._session)
@@ -1,13 +1,15 @@
-from contextlib import contextmanager
-from queue import Queue
-from threading import Event, Timer
-from time import sleep
+import signal
+import weakref
+from queue import Empty, Queue
+from threading import Event, Thread, Timer
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from dakara_base.safe_workers import (
     BaseSafeThread,
     BaseWorker,
+    ErrorSlot,
+    NoErrorCaughtError,
     Runner,
     SafeThread,
     SafeTimer,
@@ -16,7 +18,11 @@ from dakara_base.safe_workers import (
     Worker,
     WorkerSafeThread,
     WorkerSafeTimer,
+    drain_errors,
+    notify_error,
     safe,
+    wait,
+    wait_interruptible,
 )
 
 
@@ -29,7 +35,7 @@ class MyError(Exception):
 class BaseTestCase(TestCase):
     """Generic test case.
 
-    It includes some dummy functions a new assertion method.
+    It includes some dummy functions and a new assertion method.
     """
 
     def setUp(self):
@@ -45,45 +51,208 @@ class BaseTestCase(TestCase):
         """Function that raises a MyError."""
         raise MyError("test error")
 
-    @contextmanager
-    def assertNotRaises(self, ExceptionClass):
-        """Assert that the provided exception does not raise.
+    def assertPristine(self):
+        """Assert that the stop event is not set and the errors queue is empty."""
+        self.assertFalse(self.stop.is_set())
+        self.assertTrue(self.errors.empty())
 
-        Args:
-            ExceptionClass (class): Class of the exception.
-        """
+
+class ErrorSlotTestCase(TestCase):
+    """Test the ErrorSlot class."""
+
+    def setUp(self):
+        # create errors slot
+        self.errors = ErrorSlot()
+
+    def test_put_get(self):
+        """Test to put and get an error."""
+        # pre assertions
+        self.assertTrue(self.errors.empty())
+
+        # put an error
+        self.errors.put_nowait("error")
+
+        # assert the slot is full
+        self.assertFalse(self.errors.empty())
+        self.assertTrue(self.errors.ready.is_set())
+
+        # get the error
+        self.assertEqual(self.errors.get(), "error")
+
+        # post assertions
+        self.assertTrue(self.errors.empty())
+
+    def test_put_full(self):
+        """Test only the first error is kept."""
+        self.errors.put_nowait("first error")
+        self.errors.put("second error")
+
+        # assert the first error is kept
+        self.assertEqual(self.errors.get_nowait(), "first error")
+        self.assertTrue(self.errors.empty())
+
+    def test_put_concurrent(self):
+        """Test only one error is kept when put from several threads."""
+        threads = [
+            Thread(target=self.errors.put_nowait, args=(f"error {i}",))
+            for i in range(10)
+        ]
+
+        # put the errors
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        # assert only one error is kept
+        self.assertRegex(self.errors.get_nowait(), r"error \d")
+        self.assertTrue(self.errors.empty())
+        self.assertFalse(self.errors.ready.is_set())
+
+        # assert the slot can be used again
+        self.errors.put_nowait("error")
+        self.assertEqual(self.errors.get_nowait(), "error")
+
+    def test_get_empty(self):
+        """Test to get an error from an empty slot."""
+        with self.assertRaises(Empty):
+            self.errors.get_nowait()
+
+        with self.assertRaises(Empty):
+            self.errors.get(timeout=0.01)
+
+    def test_get_wait(self):
+        """Test to wait for an error."""
+        Timer(0.1, self.errors.put_nowait, args=("error",)).start()
+
+        # get the error
+        self.assertEqual(self.errors.get(timeout=5), "error")
+
+    def test_drain(self):
+        """Test to get all the errors of the slot."""
+        # drain an empty slot
+        self.assertEqual(self.errors.drain(), [])
+
+        # drain a full slot
+        self.errors.put_nowait("error")
+        self.assertEqual(self.errors.drain(), ["error"])
+        self.assertTrue(self.errors.empty())
+
+    def test_safe_thread(self):
+        """Test to use the slot with a safe thread."""
+        stop = Event()
+
+        def function_error():
+            raise MyError("test error")
+
+        # run thread
+        thread = SafeThread(stop, self.errors, target=function_error)
+        thread.start()
+        thread.join()
+
+        # post assertions
+        self.assertTrue(stop.is_set())
+        error = self.errors.get_nowait()
+        self.assertIsInstance(error, MyError)
+
+
+class DrainErrorsTestCase(TestCase):
+    """Test the `drain_errors` function."""
+
+    def test_queue(self):
+        """Test to drain a queue."""
+        errors = Queue()
+        errors.put_nowait("first error")
+        errors.put_nowait("second error")
+
+        # call the function
+        drained = drain_errors(errors)
+
+        # post assertions
+        self.assertEqual(drained, ["first error", "second error"])
+        self.assertTrue(errors.empty())
+
+    def test_queue_empty(self):
+        """Test to drain an empty queue."""
+        self.assertEqual(drain_errors(Queue()), [])
+
+    def test_error_slot(self):
+        """Test to drain an error slot."""
+        errors = ErrorSlot()
+        errors.put_nowait("error")
+
+        # call the function
+        drained = drain_errors(errors)
+
+        # post assertions
+        self.assertEqual(drained, ["error"])
+        self.assertTrue(errors.empty())
+
+
+class NotifyErrorTestCase(BaseTestCase):
+    """Test the `notify_error` function."""
+
+    def test_notify(self):
+        """Test to notify an error."""
+        # pre assertions
+        self.assertPristine()
+
+        # call the function
         try:
-            yield None
+            raise MyError("error")
 
-        except ExceptionClass:
-            self.fail("{} raised".format(ExceptionClass.__name__))
+        except MyError as error:
+            notify_error(self.stop, self.errors, error)
 
+        # post assertions
+        self.assertTrue(self.stop.is_set())
+        error = self.errors.get_nowait()
+        self.assertIsInstance(error, MyError)
 
-class SafeTestCase(BaseTestCase):
-    """Test the `safe` decorator."""
 
-    def create_classes(self):
-        """Create dummy classes."""
+class SafeMethods:
+    """Dummy class with safe methods."""
 
-        class Base:
-            @safe
-            def function_safe(self2):
-                self.function_safe()
+    @safe
+    def function_safe(self):
+        """Method that does not raise any error."""
+        return
 
-            @safe
-            def function_error(self2):
-                self.function_error()
+    @safe
+    def function_error(self):
+        """Method that raises a MyError."""
+        raise MyError("test error")
 
-        class Thread(BaseSafeThread, Base):
-            pass
 
-        class Worker(BaseWorker, Base):
-            pass
+class ThreadSafeMethods(BaseSafeThread, SafeMethods):
+    """Dummy safe thread class with safe methods."""
+
+    pass
+
+
+class WorkerSafeMethods(BaseWorker, SafeMethods):
+    """Dummy worker class with safe methods."""
+
+    pass
 
-        class Other(Base):
-            pass
 
-        return Thread, Worker, Other
+class OtherSafeMethods(SafeMethods):
+    """Dummy class with safe methods, which is not supported."""
+
+    pass
+
+
+class SafeTestCase(BaseTestCase):
+    """Test the `safe` decorator."""
+
+    def setUp(self):
+        super().setUp()
+
+        # create instances, they do not start any thread
+        self.worker = WorkerSafeMethods(self.stop, self.errors)
+        self.thread = ThreadSafeMethods(self.stop, self.errors)
+        self.other = OtherSafeMethods()
 
     def test_worker_function_safe(self):
         """Test a safe function of a worker.
@@ -92,19 +261,13 @@ class SafeTestCase(BaseTestCase):
         the stop event and does not put an error in the error queue.
         """
         # pre assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
-
-        # create instance
-        _, Worker, _ = self.create_classes()
-        worker = Worker(self.stop, self.errors)
+        self.assertPristine()
 
         # call the method
-        worker.function_safe()
+        self.worker.function_safe()
 
         # post assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
+        self.assertPristine()
 
     def test_worker_function_error(self):
         """Test an error function of a worker.
@@ -113,22 +276,76 @@ class SafeTestCase(BaseTestCase):
         event and puts a MyError in the error queue.
         """
         # pre assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
-
-        # create instance
-        _, Worker, _ = self.create_classes()
-        worker = Worker(self.stop, self.errors)
+        self.assertPristine()
 
         # call the method
-        with self.assertNotRaises(MyError):
-            worker.function_error()
+        try:
+            self.worker.function_error()
+
+        except MyError:
+            self.fail("MyError raised")
 
         # post assertions
         self.assertTrue(self.stop.is_set())
         self.assertFalse(self.errors.empty())
-        _, error, _ = self.errors.get()
+        error = self.errors.queue[0]
+        self.assertIsInstance(error, MyError)
+
+    def test_worker_function_error_order(self):
+        """Test an error function of a worker puts the error first.
+
+        Test that the error is already in the error queue when the stop event
+        is set.
+        """
+        errors = self.errors
+
+        class StopEvent(Event):
+            def set(self):
+                # assert the error is already there
+                self.errors_empty = errors.empty()
+                super().set()
+
+        stop = StopEvent()
+
+        # create instance
+        worker = WorkerSafeMethods(stop, self.errors)
+
+        # call the method
+        worker.function_error()
+
+        # post assertions
+        self.assertTrue(stop.is_set())
+        self.assertFalse(stop.errors_empty)
+
+    def test_worker_function_error_frames(self):
+        """Test an error function of a worker releases its local variables.
+
+        Test that the local variables of the function are not kept alive by
+        the traceback of the error in the error queue.
+        """
+
+        class Resource:
+            pass
+
+        references = []
+
+        class WorkerFrames(BaseWorker):
+            @safe
+            def function_error(self2):
+                resource = Resource()
+                references.append(weakref.ref(resource))
+                raise MyError("error")
+
+        worker = WorkerFrames(self.stop, self.errors)
+
+        # call the method
+        worker.function_error()
+
+        # post assertions
+        self.assertIsNone(references[0]())
+        error = self.errors.queue[0]
         self.assertIsInstance(error, MyError)
+        self.assertIsNotNone(error.__traceback__)
 
     def test_thread(self):
         """Test a thread.
@@ -137,40 +354,40 @@ class SafeTestCase(BaseTestCase):
         the stop event and does not put an error in the error queue.
         """
         # pre assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
-
-        # create instance
-        Thread, _, _ = self.create_classes()
-        thread = Thread(self.stop, self.errors)
+        self.assertPristine()
 
         # call the method
-        thread.function_safe()
+        self.thread.function_safe()
 
         # post assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
+        self.assertPristine()
 
     def test_other(self):
         """Test an other class.
 
+        Test that a non-error function does not trigger any error.
+        """
+        # call the method
+        self.other.function_safe()
+
+    def test_other_error(self):
+        """Test an other class with an error function.
+
         Test that the decorator raises an error, as the class is not supported.
         """
         # pre assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
-
-        # create instance
-        _, _, Other = self.create_classes()
-        other = Other()
+        self.assertPristine()
 
         # call the method
-        with self.assertRaises(AssertionError):
-            other.function_safe()
+        with self.assertRaisesRegex(
+            TypeError,
+            "The class 'OtherSafeMethods' of method 'function_error' is not a",
+        ) as error:
+            self.other.function_error()
 
         # post assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
+        self.assertIsInstance(error.exception.__cause__, MyError)
+        self.assertPristine()
 
 
 class SafeThreadTestCase(BaseTestCase):
@@ -180,6 +397,16 @@ class SafeThreadTestCase(BaseTestCase):
         """Helper to create a safe thread for a target function."""
         return SafeThread(self.stop, self.errors, target=target)
 
+    def test_slots(self):
+        """Test the stop event and errors queue are not in the dictionary."""
+        controlled_thread = self.create_controlled_thread(self.function_safe)
+
+        # assert the attributes
+        self.assertIs(controlled_thread.stop, self.stop)
+        self.assertIs(controlled_thread.errors, self.errors)
+        self.assertNotIn("stop", vars(controlled_thread))
+        self.assertNotIn("errors", vars(controlled_thread))
+
     def test_function_safe(self):
         """Test a safe function.
 
@@ -188,8 +415,7 @@ class SafeThreadTestCase(BaseTestCase):
         error queue.
         """
         # pre assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
+        self.assertPristine()
 
         # create thread
         controlled_thread = self.create_controlled_thread(self.function_safe)
@@ -199,8 +425,7 @@ class SafeThreadTestCase(BaseTestCase):
         controlled_thread.join()
 
         # post assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
+        self.assertPristine()
 
     def test_function_error(self):
         """Test an error function.
@@ -209,21 +434,23 @@ class SafeThreadTestCase(BaseTestCase):
         sets the stop event and puts a MyError in the error queue.
         """
         # pre assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
+        self.assertPristine()
 
         # create thread
         controlled_thread = self.create_controlled_thread(self.function_error)
 
         # run thread
-        with self.assertNotRaises(MyError):
+        try:
             controlled_thread.start()
             controlled_thread.join()
 
+        except MyError:
+            self.fail("MyError raised")
+
         # post assertions
         self.assertTrue(self.stop.is_set())
         self.assertFalse(self.errors.empty())
-        _, error, _ = self.errors.get()
+        error = self.errors.queue[0]
         self.assertIsInstance(error, MyError)
 
 
@@ -233,14 +460,64 @@ class SafeTimerTestCase(SafeThreadTestCase):
     def create_controlled_thread(self, target):
         """Helper to create a safe timer thread for a target function.
 
-        The delay is non null (0.5 s).
+        The delay is null, the timer still waits for it before calling the
+        function.
         """
-        return SafeTimer(self.stop, self.errors, 0.5, target)  # set a non-null delay
+        return SafeTimer(self.stop, self.errors, 0, target)
+
+    def test_run_stopped(self):
+        """Test the function is not called if the program is stopped."""
+        target = MagicMock()
+        timer = SafeTimer(self.stop, self.errors, 0, target)
+
+        # pre assertions
+        self.stop.set()
+
+        # call the method
+        timer.start()
+        timer.join(1)
+
+        # post assertions
+        self.assertFalse(timer.is_alive())
+        target.assert_not_called()
+        self.assertTrue(self.errors.empty())
 
 
 class WorkerTestCase(BaseTestCase):
     """Test the Worker class."""
 
+    def test_create_thread(self):
+        """Test to create a safe thread bound to the worker."""
+        worker = Worker(self.stop, self.errors)
+        thread = worker.create_thread(target=self.function_safe, name="thread")
+
+        # assert the thread
+        self.assertIsInstance(thread, SafeThread)
+        self.assertIs(thread.stop, self.stop)
+        self.assertIs(thread.errors, self.errors)
+        self.assertEqual(thread.name, "thread")
+
+    def test_create_timer(self):
+        """Test to create a safe timer bound to the worker."""
+        worker = Worker(self.stop, self.errors)
+        timer = worker.create_timer(5, self.function_safe)
+
+        # assert the timer
+        self.assertIsInstance(timer, SafeTimer)
+        self.assertIs(timer.stop, self.stop)
+        self.assertIs(timer.errors, self.errors)
+        self.assertEqual(timer.interval, 5)
+
+    def test_create_thread_reassigned(self):
+        """Test to create a safe thread after reassigning the errors queue."""
+        worker = Worker(self.stop, self.errors)
+        errors = Queue()
+        worker.errors = errors
+        thread = worker.create_thread(target=self.function_safe)
+
+        # assert the thread
+        self.assertIs(thread.errors, errors)
+
     def test_run_safe(self):
         """Test a safe run.
 
@@ -248,8 +525,7 @@ class WorkerTestCase(BaseTestCase):
         finishes with a triggered stop event and an empty error queue.
         """
         # pre assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
+        self.assertPristine()
 
         # create and run worker
         with Worker(self.stop, self.errors):
@@ -266,8 +542,7 @@ class WorkerTestCase(BaseTestCase):
         with a triggered stop event and an empty error queue.
         """
         # pre assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
+        self.assertPristine()
 
         # create and run worker
         with self.assertRaises(MyError):
@@ -287,8 +562,7 @@ class WorkerTestCase(BaseTestCase):
         error, finishes with a triggered stop event and an empty error queue.
         """
         # pre assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
+        self.assertPristine()
 
         # create and run worker
         with Worker(self.stop, self.errors) as worker:
@@ -308,20 +582,22 @@ class WorkerTestCase(BaseTestCase):
         queue.
         """
         # pre assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
+        self.assertPristine()
 
         # create and run worker
-        with self.assertNotRaises(MyError):
+        try:
             with Worker(self.stop, self.errors) as worker:
                 worker.thread = worker.create_thread(target=self.function_error)
                 worker.thread.start()
                 worker.thread.join()
 
+        except MyError:
+            self.fail("MyError raised")
+
         # post assertions
         self.assertTrue(self.stop.is_set())
         self.assertFalse(self.errors.empty())
-        _, error, _ = self.errors.get()
+        error = self.errors.queue[0]
         self.assertIsInstance(error, MyError)
 
 
@@ -331,18 +607,26 @@ class WorkerSafeTimerTestCase(BaseTestCase):
     class WorkerSafeTimerToTest(WorkerSafeTimer):
         """Dummy worker class."""
 
+        __slots__ = ("started",)
+
+        def init_worker(self):
+            self.started = Event()
+            return self.function_already_dead
+
         def function_already_dead(self):
             """Function that ends immediately."""
             return
 
         def function_to_cancel(self):
-            """Function that calls itself in loop every second."""
-            self.timer = Timer(1, self.function_to_cancel)
+            """Function that replaces the timer by a waiting one."""
+            self.timer = self.create_timer(60, self.function_already_dead)
             self.timer.start()
+            self.started.set()
 
         def function_to_join(self):
-            """Function that waits one second."""
-            sleep(1)
+            """Function that waits for the stop event."""
+            self.started.set()
+            self.stop.wait(5)
 
     def test_run_timer_dead(self):
         """Test to end a worker when its timer is dead.
@@ -351,8 +635,7 @@ class WorkerSafeTimerTestCase(BaseTestCase):
         triggered stop event, an empty error queue and a still dead timer.
         """
         # pre assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
+        self.assertPristine()
 
         # create and run worker
         with self.WorkerSafeTimerToTest(self.stop, self.errors) as worker:
@@ -372,14 +655,13 @@ class WorkerSafeTimerTestCase(BaseTestCase):
         triggered stop event, an empty error queue and a dead timer.
         """
         # pre assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
+        self.assertPristine()
 
         # create and run worker
         with self.WorkerSafeTimerToTest(self.stop, self.errors) as worker:
             worker.timer = worker.create_timer(0, worker.function_to_cancel)
             worker.timer.start()
-            sleep(0.5)
+            worker.started.wait(1)
 
         # post assertions
         self.assertTrue(self.stop.is_set())
@@ -394,41 +676,52 @@ class WorkerSafeTimerTestCase(BaseTestCase):
         triggered stop event, an empty error queue and a dead timer.
         """
         # pre assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
+        self.assertPristine()
 
         # create and run worker
         with self.WorkerSafeTimerToTest(self.stop, self.errors) as worker:
             worker.timer = worker.create_timer(0, worker.function_to_join)
             worker.timer.start()
-            sleep(0.5)
+            worker.started.wait(1)
 
         # post assertions
         self.assertTrue(self.stop.is_set())
         self.assertTrue(self.errors.empty())
         self.assertFalse(worker.timer.is_alive())
 
+    def test_slots(self):
+        """Test the worker does not have an instance dictionary."""
+        worker = self.WorkerSafeTimerToTest(self.stop, self.errors)
+
+        # assert the attributes
+        self.assertFalse(hasattr(worker, "__dict__"))
+        self.assertIsInstance(worker.timer, SafeTimer)
+
+    def test_timer_assigned(self):
+        """Test the timer can be assigned by the custom init method."""
+
+        class WorkerSafeTimerAssigned(WorkerSafeTimer):
+            def init_worker(self):
+                self.timer = self.create_timer(5, self.stop.set)
+
+        worker = WorkerSafeTimerAssigned(self.stop, self.errors)
+
+        # assert the timer
+        self.assertIsInstance(worker.timer, SafeTimer)
+        self.assertEqual(worker.timer.interval, 5)
+
     def test_unredifined_timer(self):
         """Test the timer must be redefined.
 
-        Test that a worker worker with its default timer does not generate an
-        error, but finishes with a triggered stop event and an non-empty error
-        queue.
+        Test that a worker with no timer cannot be created.
         """
-        # pre assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
-
-        # create and run worker
-        with self.assertNotRaises(UnredefinedTimerError):
-            with self.WorkerSafeTimerToTest(self.stop, self.errors) as worker:
-                worker.timer.start()
+        with self.assertRaisesRegex(
+            UnredefinedTimerError, "You must redefine the timer of a WorkerSafeTimer"
+        ):
+            WorkerSafeTimer(self.stop, self.errors)
 
         # post assertions
-        self.assertTrue(self.stop.is_set())
-        self.assertFalse(self.errors.empty())
-        _, error, _ = self.errors.get()
-        self.assertIsInstance(error, UnredefinedTimerError)
+        self.assertPristine()
 
 
 class WorkerSafeThreadTestCase(BaseTestCase):
@@ -437,13 +730,20 @@ class WorkerSafeThreadTestCase(BaseTestCase):
     class WorkerSafeThreadToTest(WorkerSafeThread):
         """Dummy worker class."""
 
+        __slots__ = ("started",)
+
+        def init_worker(self):
+            self.started = Event()
+            return self.function_already_dead
+
         def function_already_dead(self):
             """Function that ends immediately."""
             return
 
         def function_to_join(self):
-            """Function that waits one second."""
-            sleep(1)
+            """Function that waits for the stop event."""
+            self.started.set()
+            self.stop.wait(5)
 
     def test_run_thread_dead(self):
         """Test to end a worker when its thread is dead.
@@ -452,8 +752,7 @@ class WorkerSafeThreadTestCase(BaseTestCase):
         triggered stop event, an empty error queue and a still dead thread.
         """
         # pre assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
+        self.assertPristine()
 
         # create and run worker
         with self.WorkerSafeThreadToTest(self.stop, self.errors) as worker:
@@ -473,41 +772,150 @@ class WorkerSafeThreadTestCase(BaseTestCase):
         triggered stop event, an empty error queue and a dead thread.
         """
         # pre assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
+        self.assertPristine()
 
         # create and run worker
-        with self.WorkerSafeThreadToTest(self.stop, self.errors) as worker:
-            worker.thread = worker.create_thread(target=worker.function_to_join)
-            worker.thread.start()
-            sleep(0.5)
+        with self.assertLogs("dakara_base.safe_workers", "DEBUG") as logger:
+            with self.WorkerSafeThreadToTest(self.stop, self.errors) as worker:
+                worker.thread = worker.create_thread(
+                    target=worker.function_to_join, name="thread"
+                )
+                worker.thread.start()
+                worker.started.wait(1)
 
         # post assertions
         self.assertTrue(self.stop.is_set())
         self.assertTrue(self.errors.empty())
         self.assertFalse(worker.thread.is_alive())
 
+        # assert the logs
+        self.assertListEqual(
+            logger.output,
+            [
+                "DEBUG:dakara_base.safe_workers:Closing worker safe thread "
+                "'thread' (WorkerSafeThreadToTest)",
+                "DEBUG:dakara_base.safe_workers:Closed worker safe thread "
+                "'thread' (WorkerSafeThreadToTest)",
+            ],
+        )
+
+    def test_slots(self):
+        """Test the worker does not have an instance dictionary."""
+        worker = self.WorkerSafeThreadToTest(self.stop, self.errors)
+
+        # assert the attributes
+        self.assertFalse(hasattr(worker, "__dict__"))
+        self.assertIs(worker.stop, self.stop)
+        self.assertIs(worker.errors, self.errors)
+        self.assertIsInstance(worker.thread, SafeThread)
+
+    def test_thread_assigned(self):
+        """Test the thread can be assigned by the custom init method."""
+
+        class WorkerSafeThreadAssigned(WorkerSafeThread):
+            def init_worker(self):
+                self.thread = self.create_thread(target=self.stop.set, name="own")
+
+        worker = WorkerSafeThreadAssigned(self.stop, self.errors)
+
+        # assert the thread
+        self.assertIsInstance(worker.thread, SafeThread)
+        self.assertEqual(worker.thread.name, "own")
+
     def test_unredifined_thread(self):
         """Test the thread must be redefined.
 
-        Test that a worker worker with its default thread does not generate an
-        error, but finishes with a triggered stop event and an non-empty error
-        queue.
+        Test that a worker with no thread cannot be created.
         """
-        # pre assertions
-        self.assertFalse(self.stop.is_set())
-        self.assertTrue(self.errors.empty())
+        with self.assertRaisesRegex(
+            UnredefinedThreadError, "You must redefine the thread of a WorkerSafeThread"
+        ):
+            WorkerSafeThread(self.stop, self.errors)
 
-        # create and run worker
-        with self.assertNotRaises(UnredefinedThreadError):
-            with self.WorkerSafeThreadToTest(self.stop, self.errors) as worker:
-                worker.thread.start()
+        # post assertions
+        self.assertPristine()
+
+
+class WaitTestCase(BaseTestCase):
+    """Test the `wait` and `wait_interruptible` functions."""
+
+    @patch("dakara_base.safe_workers.wait_interruptible", autospec=True)
+    @patch("dakara_base.safe_workers.IS_WINDOWS", True)
+    def test_wait_windows(self, mocked_wait_interruptible):
+        """Test to wait on Windows."""
+        # call the function
+        wait(self.stop)
+
+        # assert the call
+        mocked_wait_interruptible.assert_called_once_with(self.stop)
+
+    @patch("dakara_base.safe_workers.wait_interruptible", autospec=True)
+    @patch("dakara_base.safe_workers.IS_WINDOWS", False)
+    def test_wait_linux(self, mocked_wait_interruptible):
+        """Test to wait on Linux."""
+        self.stop.set()
+
+        # call the function
+        wait(self.stop)
+
+        # assert the call
+        mocked_wait_interruptible.assert_not_called()
+
+    @patch("dakara_base.safe_workers.socket.socketpair", autospec=True)
+    def test_wait_interruptible_already_stopped(self, mocked_socketpair):
+        """Test to wait when the stop event is already set."""
+        self.stop.set()
+
+        # call the function
+        wait_interruptible(self.stop)
+
+        # assert the call
+        mocked_socketpair.assert_not_called()
+
+    def test_wait_interruptible_stop(self):
+        """Test to wait until the stop event is set."""
+        Timer(0.1, self.stop.set).start()
+
+        # call the function
+        wait_interruptible(self.stop)
 
         # post assertions
         self.assertTrue(self.stop.is_set())
-        self.assertFalse(self.errors.empty())
-        _, error, _ = self.errors.get()
-        self.assertIsInstance(error, UnredefinedThreadError)
+
+    def test_wait_interruptible_signal(self):
+        """Test to interrupt the wait with Ctrl+C."""
+        # get the current wakeup file descriptor
+        previous_fd = signal.set_wakeup_fd(-1)
+        signal.set_wakeup_fd(previous_fd)
+
+        Timer(0.1, signal.raise_signal, args=(signal.SIGINT,)).start()
+
+        # call the function
+        with self.assertRaises(KeyboardInterrupt):
+            wait_interruptible(self.stop)
+
+        # post assertions
+        self.assertFalse(self.stop.is_set())
+
+        # assert the wakeup file descriptor has been restored
+        try:
+            self.assertEqual(signal.set_wakeup_fd(-1), previous_fd)
+
+        finally:
+            signal.set_wakeup_fd(previous_fd)
+
+        # release the helper thread
+        self.stop.set()
+
+    def test_wait_interruptible_not_main_thread(self):
+        """Test to wait from another thread than the main one."""
+        thread = Thread(target=wait_interruptible, args=(self.stop,))
+        thread.start()
+        self.stop.set()
+        thread.join(1)
+
+        # post assertions
+        self.assertFalse(thread.is_alive())
 
 
 class RunnerTestCase(BaseTestCase):
@@ -535,32 +943,95 @@ class RunnerTestCase(BaseTestCase):
         def test(self):
             raise MyError("test error")
 
+    class WorkerErrors(Worker):
+        """Dummy worker class that will fail with several errors."""
+
+        def init_worker(self):
+            self.thread = self.create_thread(target=self.test)
+
+        def test(self):
+            try:
+                raise MyError("first error")
+
+            except MyError as error:
+                self.errors.put_nowait(error)
+
+            raise MyError("second error")
+
+    class WorkerStop(Worker):
+        """Dummy worker class that will stop without error."""
+
+        def init_worker(self):
+            self.thread = self.create_thread(target=self.stop.set)
+
     def setUp(self):
         # create class to test
         self.runner = Runner()
 
+    def test_init_invalid_stop(self):
+        """Test to create a runner with an invalid stop event."""
+
+        class InvalidRunner(Runner):
+            def init_runner(self):
+                self.stop = None
+
+        with self.assertRaisesRegex(TypeError, "Stop attribute must be"):
+            InvalidRunner()
+
+    def test_init_invalid_errors(self):
+        """Test to create a runner with an invalid errors slot."""
+
+        class InvalidRunner(Runner):
+            def init_runner(self):
+                self.errors = []
+
+        with self.assertRaisesRegex(TypeError, "Errors attribute must be"):
+            InvalidRunner()
+
+    def test_init_queue(self):
+        """Test to create a runner with an errors queue."""
+
+        class QueueRunner(Runner):
+            def init_runner(self):
+                self.errors = Queue()
+
+        runner = QueueRunner()
+
+        # assert the errors queue
+        self.assertIsInstance(runner.errors, Queue)
+
+    @patch("dakara_base.safe_workers.IS_WINDOWS", False)
     def test_run_safe_interrupt(self):
         """Test a run with an interruption by KeyboardInterrupt exception.
 
         The run should end with a set stop event and an empty errors queue.
+
+        The wait is forced to be the one of POSIX systems, as on Windows the
+        stop event is waited for in a helper thread.
         """
         # pre assertions
         self.assertFalse(self.runner.stop.is_set())
         self.assertTrue(self.runner.errors.empty())
 
         # modify stop event wait method
-        self.runner.stop.wait = MagicMock()
-        self.runner.stop.wait.side_effect = KeyboardInterrupt
+        calls = []
+
+        def wait_interrupted(*args, **kwargs):
+            calls.append((args, kwargs))
+            raise KeyboardInterrupt
+
+        self.runner.stop.wait = wait_interrupted
 
         # call the method
         self.runner.run_safe(self.WorkerNormal)
 
         # post assertions
         self.assertTrue(self.runner.stop.is_set())
+        self.assertTrue(self.runner.interrupted.is_set())
         self.assertTrue(self.runner.errors.empty())
 
         # assert stop event wait method was called
-        self.runner.stop.wait.assert_called_once()
+        self.assertEqual(len(calls), 1)
 
     def test_run_safe_error(self):
         """Test a run with an error.
@@ -579,3 +1050,82 @@ class RunnerTestCase(BaseTestCase):
         # post assertions
         self.assertTrue(self.runner.stop.is_set())
         self.assertTrue(self.runner.errors.empty())
+        self.assertFalse(self.runner.interrupted.is_set())
+
+    def test_run_safe_shared(self):
+        """Test the worker and its threads share the objects of the runner."""
+        shared = []
+
+        class WorkerShared(Worker):
+            def init_worker(self):
+                self.thread = self.create_thread(target=self.test)
+
+            def test(self):
+                timer = self.create_timer(0, self.stop.set)
+                shared.extend([self.stop, self.errors, self.thread.stop, timer.errors])
+                timer.start()
+
+        # call the method
+        with self.assertRaises(NoErrorCaughtError):
+            self.runner.run_safe(WorkerShared)
+
+        # post assertions
+        self.assertEqual(len(shared), 4)
+        self.assertIs(shared[0], self.runner.stop)
+        self.assertIs(shared[1], self.runner.errors)
+        self.assertIs(shared[2], self.runner.stop)
+        self.assertIs(shared[3], self.runner.errors)
+
+    def test_run_safe_invalid_worker(self):
+        """Test to run a class which is not a worker."""
+
+        class NotAWorker:
+            pass
+
+        # call the method
+        with self.assertRaisesRegex(
+            TypeError, "The worker class 'NotAWorker' is not a BaseWorker"
+        ):
+            self.runner.run_safe(NotAWorker)
+
+        # post assertions
+        self.assertFalse(self.runner.stop.is_set())
+        self.assertTrue(self.runner.errors.empty())
+
+    def test_run_safe_no_error(self):
+        """Test a run stopped without error.
+
+        The run should raise a NoErrorCaughtError immediately.
+        """
+        # call the method
+        with self.assertRaises(NoErrorCaughtError):
+            self.runner.run_safe(self.WorkerStop)
+
+        # post assertions
+        self.assertTrue(self.runner.stop.is_set())
+        self.assertFalse(self.runner.interrupted.is_set())
+
+    def test_run_safe_errors(self):
+        """Test a run with several errors.
+
+        The run should raise the first error and empty the errors queue.
+        """
+
+        class QueueRunner(Runner):
+            def init_runner(self):
+                self.errors = Queue()
+
+        runner = QueueRunner()
+
+        # call the method
+        with self.assertLogs("dakara_base.safe_workers", "DEBUG") as logger:
+            with self.assertRaisesRegex(MyError, "first error"):
+                runner.run_safe(self.WorkerErrors)
+
+        # post assertions
+        self.assertTrue(runner.errors.empty())
+        self.assertIn(
+            "DEBUG:dakara_base.safe_workers:"
+            "2 errors caught, only the first one is raised",
+            logger.output,
+        )
@@ -102,6 +102,22 @@ class WebSocketClientTestCase(TestCase):
         self.assertEqual(self.client.header, self.header)
         self.assertEqual(self.client.reconnect_interval, self.reconnect_interval)
         self.assertIsNone(self.client.websocket)
+        self.assertEqual(self.client.timer.function, self.client.run)
+
+    def test_init_worker_subclass(self):
+        """Test the initialization of a subclass calling the parent method."""
+
+        class WebSocketClientSubclass(WebSocketClient):
+            def init_worker(self, *args, **kwargs):
+                super().init_worker(*args, **kwargs)
+                self.extra = True
+
+        # create the object
+        client = WebSocketClientSubclass(self.stop, self.errors, {"url": self.url})
+
+        # assert the object
+        self.assertTrue(client.extra)
+        self.assertEqual(client.timer.function, client.run)
 
     def test_set_callback(self):
         """Test the assignation of a callback."""
@@ -328,7 +344,7 @@ class WebSocketClientTestCase(TestCase):
 
         # assert the list of errors is not empty
         self.assertFalse(self.errors.empty())
-        _, error, _ = self.errors.get()
+        error = self.errors.queue[0]
         self.assertIsInstance(error, AuthenticationError)
 
     def test_on_error_network_normal(self):
@@ -342,7 +358,7 @@ class WebSocketClientTestCase(TestCase):
 
         # assert the list of errors is not empty
         self.assertFalse(self.errors.empty())
-        _, error, _ = self.errors.get()
+        error = self.errors.queue[0]
         self.assertIsInstance(error, NetworkError)
 
     def test_on_error_network_retry(self):
@@ -379,7 +395,7 @@ class WebSocketClientTestCase(TestCase):
 
         # assert the call
         self.assertFalse(self.errors.empty())
-        _, error, _ = self.errors.get()
+        error = self.errors.queue[0]
         self.assertIsInstance(error, ParameterError)
 
     def test_on_error_closed(self):